@@ -3,12 +3,15 @@
 Complete Backend with Frontend and Social Media Setup
 """
 
-from flask import Flask, request, jsonify, render_template_string
+from flask import Flask, Response, g, request, jsonify, render_template_string
 from flask_cors import CORS
 import sqlite3
 import json
 from datetime import datetime, timezone
 import os
+import queue
+import threading
+import time
 
 app = Flask(__name__)
 CORS(app)
@@ -16,6 +19,30 @@ CORS(app)
 # Database setup
 DATABASE = 'proper_social_data.db'
 
+# Analytics columns written from a POSTed analytics dict, with their defaults
+ANALYTICS_DEFAULTS = (
+    ('followers', 0), ('following', 0), ('tweets', 0), ('likes', 0),
+    ('retweets', 0), ('replies', 0), ('impressions', 0), ('profile_views', 0),
+    ('engagement', 0), ('quality_score', 0), ('reach', 0), ('verified', False),
+    ('data_source', 'api')
+)
+CONNECTION_COLUMNS = (
+    ('platform', 'username', 'account_name', 'account_type', 'client_id', 'connected', 'last_connected')
+    + tuple(field for field, _ in ANALYTICS_DEFAULTS)
+    + ('raw_analytics',)
+)
+
+# Single-platform lookup, served by the unique idx_social_platform index
+SQL_SELECT_CONNECTION = 'SELECT * FROM social_connections WHERE platform = ?'
+
+# Insert or update a platform's row in one statement, built once at import
+SQL_UPSERT_CONNECTION = (
+    f"INSERT INTO social_connections ({', '.join(CONNECTION_COLUMNS)}) "
+    f"VALUES ({', '.join('?' * len(CONNECTION_COLUMNS))}) "
+    f"ON CONFLICT(platform) DO UPDATE SET "
+    + ', '.join(f"{column} = excluded.{column}" for column in CONNECTION_COLUMNS[1:])
+)
+
 def init_db():
     """Initialize database if not exists"""
     if not os.path.exists(DATABASE):
@@ -25,7 +52,7 @@ def init_db():
         cursor.execute('''
             CREATE TABLE social_connections (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                platform TEXT NOT NULL,
+                platform TEXT NOT NULL UNIQUE,
                 username TEXT,
                 account_name TEXT,
                 account_type TEXT,
@@ -125,11 +152,50 @@ def init_db():
         conn.close()
         print("✅ Database initialized with real Twitter data")
 
-def get_db_connection():
-    """Get database connection"""
+    # WAL is persistent on the database file, so setting it once covers every connection
     conn = sqlite3.connect(DATABASE)
-    conn.row_factory = sqlite3.Row
-    return conn
+    conn.execute('PRAGMA journal_mode=WAL')
+    # Databases created before the UNIQUE column constraint need it for ON CONFLICT(platform)
+    conn.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_social_platform ON social_connections(platform)')
+    conn.close()
+
+# GET /api/social/connections body, served from memory for a few seconds between writes
+CONNECTIONS_CACHE_TTL = 10
+_conn_cache = {"body": None, "expires": 0.0, "generation": 0}  # generation is bumped by every write
+_conn_cache_lock = threading.Lock()
+
+# Idle connections shared across requests; the dev server starts a new thread for each one
+DB_POOL_SIZE = 4
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+def get_db_connection():
+    """Get this request's database connection, reusing an idle one from the pool if available"""
+    if 'db' not in g:
+        try:
+            g.db = _db_pool.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(DATABASE, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            g.db = conn
+    return g.db
+
+@app.teardown_appcontext
+def release_db_connection(exc):
+    """End any transaction the request left open and return its connection to the pool"""
+    conn = g.pop('db', None)
+    if conn is None:
+        return
+    if conn.in_transaction:
+        if exc is None:
+            conn.commit()
+        else:
+            conn.rollback()
+    try:
+        _db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
 
 def format_connection_data(row):
     """Format database row to JSON response"""
@@ -371,10 +437,7 @@ def home():
     """Homepage with Twitter analytics"""
     try:
         conn = get_db_connection()
-        twitter_data = conn.execute(
-            'SELECT * FROM social_connections WHERE platform = "twitter"'
-        ).fetchone()
-        conn.close()
+        twitter_data = conn.execute(SQL_SELECT_CONNECTION, ('twitter',)).fetchone()
 
         if twitter_data:
             return render_template_string(HOME_TEMPLATE,
@@ -398,10 +461,7 @@ def social_media_setup():
     """Social media setup page"""
     try:
         conn = get_db_connection()
-        twitter_data = conn.execute(
-            'SELECT * FROM social_connections WHERE platform = "twitter"'
-        ).fetchone()
-        conn.close()
+        twitter_data = conn.execute(SQL_SELECT_CONNECTION, ('twitter',)).fetchone()
 
         if twitter_data:
             return render_template_string(SETUP_TEMPLATE,
@@ -424,16 +484,26 @@ def social_connections():
     conn = get_db_connection()
 
     if request.method == 'GET':
+        now = time.time()
+        if now < _conn_cache["expires"]:
+            return Response(_conn_cache["body"], mimetype='application/json')
+        generation = _conn_cache["generation"]
+
         connections = conn.execute('SELECT * FROM social_connections').fetchall()
         result = {}
         for row in connections:
             result[row["platform"]] = format_connection_data(row)
-        conn.close()
-        return jsonify({
+        response = jsonify({
             "connections": result,
             "success": True,
             "timestamp": datetime.now(timezone.utc).isoformat()
         })
+        # A write that landed while this body was built makes it stale; don't cache it
+        with _conn_cache_lock:
+            if _conn_cache["generation"] == generation:
+                _conn_cache["body"] = response.get_data()
+                _conn_cache["expires"] = now + CONNECTIONS_CACHE_TTL
+        return response
 
     elif request.method == 'POST':
         try:
@@ -441,51 +511,33 @@ def social_connections():
             if 'twitter' in data:
                 platform_data = data['twitter']
                 analytics = platform_data.get('analytics', {})
+                now_iso = datetime.now(timezone.utc).isoformat()
 
-                cursor = conn.cursor()
-                cursor.execute('''
-                    UPDATE social_connections SET
-                        username = ?, account_name = ?, account_type = ?,
-                        client_id = ?, connected = ?, last_connected = ?,
-                        followers = ?, following = ?, tweets = ?, likes = ?,
-                        retweets = ?, replies = ?, impressions = ?, profile_views = ?,
-                        engagement = ?, quality_score = ?, reach = ?, verified = ?,
-                        data_source = ?, raw_analytics = ?
-                    WHERE platform = ?
-                ''', (
+                conn.execute(SQL_UPSERT_CONNECTION, (
+                    'twitter',
                     platform_data.get('username'),
                     platform_data.get('account_name'),
                     platform_data.get('account_type'),
                     platform_data.get('client_id'),
                     platform_data.get('connected', True),
-                    datetime.now(timezone.utc).isoformat(),
-                    analytics.get('followers', 0),
-                    analytics.get('following', 0),
-                    analytics.get('tweets', 0),
-                    analytics.get('likes', 0),
-                    analytics.get('retweets', 0),
-                    analytics.get('replies', 0),
-                    analytics.get('impressions', 0),
-                    analytics.get('profile_views', 0),
-                    analytics.get('engagement', 0),
-                    analytics.get('quality_score', 0),
-                    analytics.get('reach', 0),
-                    analytics.get('verified', False),
-                    analytics.get('data_source', 'api'),
-                    json.dumps(analytics),
-                    'twitter'
+                    now_iso,
+                    *(analytics.get(field, default) for field, default in ANALYTICS_DEFAULTS),
+                    json.dumps(analytics)
                 ))
 
                 conn.commit()
-                conn.close()
+                with _conn_cache_lock:
+                    _conn_cache["generation"] += 1
+                    _conn_cache["expires"] = 0.0
 
                 return jsonify({
                     "success": True,
-                    "message": "Twitter data updated successfully"
+                    "message": "Twitter data updated successfully",
+                    "timestamp": now_iso
                 })
 
         except Exception as e:
-            conn.close()
+            conn.rollback()
             return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/health', methods=['GET'])
@@ -1,9 +1,13 @@
 import os
+import logging
 from dotenv import load_dotenv
 from zai import ZaiClient
+from core.cache import disk_cache
 
 load_dotenv() # Load environment variables from .env file
 
+logger = logging.getLogger(__name__)
+
 ZAI_API_KEY = os.getenv("ZAI_API_KEY")
 
 if not ZAI_API_KEY:
@@ -12,17 +16,30 @@ if not ZAI_API_KEY:
 # Initialize the Zai client globally for reuse
 client = ZaiClient(api_key=ZAI_API_KEY)
 
+# Identical prompts are served from disk for a day instead of re-hitting the API
+CONTENT_CACHE_TTL = 86400
+
 def generate_content(prompt: str, model: str = "GLM-4.5-Flash") -> str:
     """
     Generates content using the Z.AI API.
+    Successful responses are cached on disk keyed by (model, prompt).
     """
-    print(f"Generating content for prompt: {prompt[:50]}... (using model: {model})")
+    cache_key = ("generate_content", model, prompt)
+    if disk_cache is not None:
+        cached = disk_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    logger.debug(f"Generating content for prompt: {prompt[:50]}... (using model: {model})")
     try:
         response = client.chat.completions.create(
             model=model,
             messages=[{"role": "user", "content": prompt}]
         )
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        if disk_cache is not None:
+            disk_cache.set(cache_key, content, expire=CONTENT_CACHE_TTL)
+        return content
     except Exception as e:
-        print(f"Error generating content: {e}")
+        logger.error(f"Error generating content: {e}")
         return f"Error: Could not generate content for prompt: {prompt}. Details: {e}"
@@ -0,0 +1,15 @@
+"""
+On-disk response cache shared across runs.
+
+Falls back to ``None`` when diskcache is not installed so callers can
+skip caching transparently.
+"""
+import os
+
+CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+
+try:
+    import diskcache
+    disk_cache = diskcache.Cache(CACHE_DIR)
+except ImportError:
+    disk_cache = None
@@ -31,6 +31,8 @@ class Config:
     # Web Server Configuration
     HOST = os.getenv('HOST', '0.0.0.0')
     PORT = int(os.getenv('PORT', '5000'))
+    WEB_WORKERS = int(os.getenv('WEB_WORKERS', str(os.cpu_count() or 1)))
+    WEB_THREADS = int(os.getenv('WEB_THREADS', '8'))
     SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
 
     # Ensure directories exist
@@ -5,18 +5,29 @@ Complete dashboard with topic management, content generation, and metrics
 """
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for, session, flash
+from jinja2 import FileSystemBytecodeCache
 import json
 import os
+import random
 import sqlite3
 import re
-from datetime import datetime, timedelta
+import sys
+from datetime import date, datetime, timedelta
 import subprocess
+import tempfile
 import threading
 import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 from twitter_client import TwitterClient
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -24,6 +35,11 @@ load_dotenv()
 app = Flask(__name__)
 app.secret_key = 'your-secret-key-here'  # Change in production
 
+# Persist compiled templates so restarts and extra workers skip recompiling them
+JINJA_CACHE_DIR = os.path.join(os.getenv("CACHE_DIR", ".cache"), "jinja")
+os.makedirs(JINJA_CACHE_DIR, exist_ok=True)
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+
 # Authentication decorator
 def login_required(f):
     from functools import wraps
@@ -64,13 +80,36 @@ except ImportError:
 
 # Database setup
 class DatabaseManager:
+    _INSERT_METRICS_SQL = (
+        "INSERT INTO metrics (date, platform, post_number, topic, views, likes, comments, shares, engagement_rate) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
     def __init__(self):
         self.db_path = 'data/metrics.db'
         self.init_database()
+        self._conn = self._connect()
+        self._lock = threading.Lock()
+
+    def reconnect(self):
+        """Reopen the shared connection, e.g. in a worker process after fork"""
+        self._conn = self._connect()
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        """Open the long-lived connection shared by the metrics queries"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
 
     def init_database(self):
         os.makedirs('data', exist_ok=True)
         with sqlite3.connect(self.db_path) as conn:
+            changes_before = conn.total_changes
             conn.executescript('''
                 CREATE TABLE IF NOT EXISTS metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -105,48 +144,88 @@ class DatabaseManager:
                     status TEXT DEFAULT 'pending',
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 );
+
+                -- Running per-topic totals so top-content reads a small table instead of aggregating metrics
+                CREATE TABLE IF NOT EXISTS topic_rollup (
+                    topic TEXT NOT NULL,
+                    platform TEXT NOT NULL,
+                    engagement_total REAL DEFAULT 0.0,
+                    post_count INTEGER DEFAULT 0,
+                    total_likes INTEGER DEFAULT 0,
+                    PRIMARY KEY (topic, platform)
+                );
+
+                CREATE TRIGGER IF NOT EXISTS trg_metrics_topic_rollup AFTER INSERT ON metrics
+                BEGIN
+                    INSERT INTO topic_rollup (topic, platform, engagement_total, post_count, total_likes)
+                    VALUES (COALESCE(NEW.topic, ''), NEW.platform, COALESCE(NEW.engagement_rate, 0), 1, COALESCE(NEW.likes, 0))
+                    ON CONFLICT(topic, platform) DO UPDATE SET
+                        engagement_total = engagement_total + excluded.engagement_total,
+                        post_count = post_count + 1,
+                        total_likes = total_likes + excluded.total_likes;
+                END;
+
+                -- Backfill databases created before the rollup existed
+                INSERT INTO topic_rollup (topic, platform, engagement_total, post_count, total_likes)
+                SELECT COALESCE(topic, ''), platform, TOTAL(engagement_rate), COUNT(*), TOTAL(likes)
+                FROM metrics
+                WHERE NOT EXISTS (SELECT 1 FROM topic_rollup)
+                GROUP BY COALESCE(topic, ''), platform;
+
+                CREATE INDEX IF NOT EXISTS idx_metrics_date_platform ON metrics(date, platform);
+                CREATE INDEX IF NOT EXISTS idx_metrics_platform ON metrics(platform);
+                CREATE INDEX IF NOT EXISTS idx_metrics_topic_platform ON metrics(topic, platform);
+                CREATE INDEX IF NOT EXISTS idx_content_log_platform ON content_log(platform);
             ''')
+            # The rollup backfill is the script's only row write, so full statistics are
+            # gathered once after it; later starts only refresh tables that went stale
+            if conn.total_changes > changes_before:
+                conn.execute('ANALYZE')
+            else:
+                conn.execute('PRAGMA optimize')
             conn.commit()
 
+    @staticmethod
+    def _metrics_row(data):
+        return (data['date'], data['platform'], data.get('post_number'), data.get('topic'),
+                data.get('views', 0), data.get('likes', 0), data.get('comments', 0),
+                data.get('shares', 0), float(data.get('engagement_rate', 0)))
+
     def add_metrics(self, data):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO metrics (date, platform, post_number, topic, views, likes, comments, shares, engagement_rate)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (data['date'], data['platform'], data.get('post_number'), data.get('topic'),
-                  data.get('views', 0), data.get('likes', 0), data.get('comments', 0),
-                  data.get('shares', 0), float(data.get('engagement_rate', 0))))
-            conn.commit()
+        with self._lock, self._conn as conn:
+            conn.execute(self._INSERT_METRICS_SQL, self._metrics_row(data))
 
-    def get_metrics_summary(self, days=30):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(f'''
-                SELECT platform, COUNT(*) as total_posts,
-                       SUM(views) as total_views, SUM(likes) as total_likes,
-                       SUM(comments) as total_comments, SUM(shares) as total_shares,
-                       AVG(engagement_rate) as avg_engagement
-                FROM metrics
-                WHERE date >= date('now', '-{days} days')
-                GROUP BY platform
-            ''')
-            return [dict(row) for row in cursor.fetchall()]
+    def add_metrics_batch(self, rows):
+        """Insert many metrics rows with one executemany in a single transaction"""
+        rows = [self._metrics_row(data) for data in rows]
+        with self._lock, self._conn as conn:
+            conn.executemany(self._INSERT_METRICS_SQL, rows)
 
     def get_top_content(self, limit=10):
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(f'''
-                SELECT topic, platform, AVG(engagement_rate) as avg_engagement,
-                       COUNT(*) as post_count, SUM(likes) as total_likes
-                FROM metrics
-                GROUP BY topic, platform
+        """Return top topics column-oriented: {'columns': [...], 'rows': [tuple, ...]}"""
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = None
+            cursor.execute('''
+                SELECT NULLIF(topic, '') as topic, platform,
+                       engagement_total / post_count as avg_engagement,
+                       post_count, total_likes
+                FROM topic_rollup
                 ORDER BY avg_engagement DESC
-                LIMIT {limit}
-            ''')
-            return [dict(row) for row in cursor.fetchall()]
+                LIMIT ?
+            ''', (int(limit),))
+            return {
+                'columns': [d[0] for d in cursor.description],
+                'rows': cursor.fetchall()
+            }
 
 db = DatabaseManager()
 
+def read_json_file(path):
+    """Parse a JSON file from its raw bytes, skipping the text-mode wrapper"""
+    raw = Path(path).read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
 # Topic Manager
 class TopicManager:
     def __init__(self):
@@ -154,8 +233,7 @@ class TopicManager:
 
     def load_topics(self):
         if os.path.exists('topics.json'):
-            with open('topics.json', 'r') as f:
-                self.topics = json.load(f)
+            self.topics = read_json_file('topics.json')
         else:
             self.topics = []
 
@@ -189,8 +267,7 @@ class TopicManager:
         return topic_data
 
     def save_topics(self):
-        with open('topics.json', 'w') as f:
-            json.dump(self.topics, f, indent=2)
+        write_json_file('topics.json', self.topics)
 
     def delete_topic(self, topic_id):
         """Delete a topic by ID - only removes from topics.json, NOT from generated content files"""
@@ -206,6 +283,188 @@ class TopicManager:
 
 topic_manager = TopicManager()
 
+def run_streaming(cmd, timeout=None, tail_lines=50):
+    """Run a command, echoing its output to the server log as it arrives.
+
+    Returns (returncode, tail) where tail is the last few output lines, kept
+    for error reporting instead of buffering the whole output in memory.
+    Raises subprocess.TimeoutExpired if the command outlives the timeout.
+    """
+    tail = deque(maxlen=tail_lines)
+    timed_out = threading.Event()
+
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1, close_fds=False) as proc:
+        def kill():
+            timed_out.set()
+            proc.kill()
+
+        timer = threading.Timer(timeout, kill) if timeout else None
+        if timer:
+            timer.start()
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=''.join(tail))
+    return returncode, ''.join(tail)
+
+def write_json_file(path, data):
+    """Write data as indented JSON, serialized with orjson when available.
+
+    The file is written to a temp file in the same directory and swapped in
+    with os.replace, so readers never see a half-written calendar.
+    """
+    if orjson is None:
+        payload = json.dumps(data, indent=2).encode()
+    else:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def json_response(data):
+    """Serialize an API payload with orjson when available, else fall back to jsonify"""
+    if orjson is None:
+        return jsonify(data)
+    return app.response_class(orjson.dumps(data), mimetype='application/json')
+
+# Short-lived cache for the metrics endpoints, shared by every dashboard tab's auto-refresh
+METRICS_CACHE_TTL = 60
+_metrics_response_cache = {}
+_metrics_response_lock = threading.Lock()
+
+def cached_metrics_response(f):
+    """Serve a metrics endpoint's serialized body from memory for METRICS_CACHE_TTL seconds"""
+    from functools import wraps
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        key = (request.path, request.query_string)
+        now = time.monotonic()
+        with _metrics_response_lock:
+            cached = _metrics_response_cache.get(key)
+        if cached and cached[0] > now:
+            return app.response_class(cached[1], mimetype='application/json')
+
+        response = f(*args, **kwargs)
+        if response.status_code == 200:
+            with _metrics_response_lock:
+                _metrics_response_cache[key] = (now + METRICS_CACHE_TTL, response.get_data())
+        return response
+    return decorated_function
+
+def invalidate_metrics_cache():
+    with _metrics_response_lock:
+        _metrics_response_cache.clear()
+
+# Calendar cache - parsed calendars are reused until the file on disk changes
+_calendar_cache = {}
+_calendar_lock = threading.Lock()
+
+def load_calendar(path):
+    """Load a JSON calendar, reusing the parsed list while the file is unchanged.
+
+    The returned list is shared between requests and must not be mutated.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        _calendar_cache.pop(path, None)
+        return []
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _calendar_cache.get(path)
+    if cached and cached['key'] == key:
+        return cached['data']
+
+    with _calendar_lock:
+        # Another thread (e.g. the prefetcher) may have parsed it meanwhile
+        cached = _calendar_cache.get(path)
+        if cached and cached['key'] == key:
+            return cached['data']
+
+        data = read_json_file(path)
+        _calendar_cache[path] = {'key': key, 'data': data, 'by_date': None}
+        return data
+
+def calendar_posts_for_date(path, day):
+    """Return the calendar items scheduled for a YYYY-MM-DD date.
+
+    Items are indexed by publish_date once per file version, so repeated
+    lookups are a dict hit instead of a scan over the whole calendar.
+    """
+    load_calendar(path)
+    cached = _calendar_cache.get(path)
+    if not cached:
+        return []
+
+    if cached['by_date'] is None:
+        with _calendar_lock:
+            if cached['by_date'] is None:
+                by_date = defaultdict(list)
+                for item in cached['data']:
+                    by_date[item.get('publish_date')].append(item)
+                cached['by_date'] = dict(by_date)
+    return cached['by_date'].get(day, [])
+
+class CalendarEdit:
+    """Mutable view of a calendar file handed out by edit_calendar()"""
+
+    def __init__(self, items):
+        self.items = items
+        self.changed = False
+
+@contextmanager
+def edit_calendar(path):
+    """Load a calendar for in-place edits and write it back once on exit.
+
+    Callers set ``edit.changed`` after modifying ``edit.items``; the file is
+    only rewritten when something changed, however many items were touched.
+    """
+    items = read_json_file(path) if os.path.exists(path) else []
+
+    edit = CalendarEdit(items)
+    yield edit
+
+    if edit.changed:
+        write_json_file(path, edit.items)
+
+# (platform, calendar file, optimal posting time) feeding the manual posting queue
+MANUAL_QUEUE_SOURCES = (
+    ('linkedin', 'outputs/content_calendar.json', '9:00 AM'),
+    ('twitter', 'outputs/twitter_calendar.json', '2:00 PM'),
+    ('instagram', 'outputs/instagram_calendar.json', '6:00 PM')
+)
+
+def prefetch_calendars():
+    """Warm the calendar cache and today's/tomorrow's queue index.
+
+    Runs in a background thread at startup so the first manual-posting
+    request does not pay for parsing and indexing the calendars.
+    """
+    today = date.today()
+    days = (today.isoformat(), (today + timedelta(days=1)).isoformat())
+    for _, path, _ in MANUAL_QUEUE_SOURCES:
+        for day in days:
+            calendar_posts_for_date(path, day)
+
 # Routes
 @app.route('/')
 @login_required
@@ -397,22 +656,21 @@ def get_content_status():
 
         for file_path in json_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    if isinstance(data, list):
-                        file_posts = len(data)
-                        total_posts += file_posts
-
-                        # Classify posts by platform based on filename
-                        filename_lower = os.path.basename(file_path).lower()
-                        if 'linkedin' in filename_lower:
-                            linkedin_posts += file_posts
-                        elif 'twitter' in filename_lower:
-                            twitter_posts += file_posts
-                        elif 'instagram' in filename_lower:
-                            instagram_posts += file_posts
-                        # General content files (like todays_posts.json) contribute to total
-                        # but aren't platform-specific
+                data = read_json_file(file_path)
+                if isinstance(data, list):
+                    file_posts = len(data)
+                    total_posts += file_posts
+
+                    # Classify posts by platform based on filename
+                    filename_lower = os.path.basename(file_path).lower()
+                    if 'linkedin' in filename_lower:
+                        linkedin_posts += file_posts
+                    elif 'twitter' in filename_lower:
+                        twitter_posts += file_posts
+                    elif 'instagram' in filename_lower:
+                        instagram_posts += file_posts
+                    # General content files (like todays_posts.json) contribute to total
+                    # but aren't platform-specific
 
             except Exception as file_error:
                 print(f"Error reading {file_path}: {file_error}")
@@ -443,7 +701,7 @@ def get_linkedin_metrics_from_csv():
     latest_engagement_rate = 0
 
     try:
-        with open(file_path, 'r') as f:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
             reader = csv.DictReader(f)
             rows = list(reader)
             total_posts = len(rows)
@@ -481,7 +739,7 @@ def get_instagram_metrics_from_csv():
     latest_engagement_rate = 0
 
     try:
-        with open(file_path, 'r') as f:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
             reader = csv.DictReader(f)
             rows = list(reader)
             total_posts = len(rows)
@@ -505,10 +763,8 @@ def get_instagram_metrics_from_csv():
         return None
 
 @app.route('/api/metrics/summary')
+@cached_metrics_response
 def get_metrics_summary():
-    # Get current month metrics
-    current_metrics = db.get_metrics_summary()
-
     # For demo purposes, calculate growth based on actual content generation
     content_status = get_content_status_json()
 
@@ -580,7 +836,6 @@ def get_metrics_summary():
     # Calculate realistic month-over-month growth based on actual content
     def calculate_growth(base_value, variance=0.3):
         """Generate realistic growth percentage with some variance"""
-        import random
         base_growth = min(50, base_value * 0.8)
         variance_factor = random.uniform(-variance, variance)
         final_growth = max(5, base_growth * (1 + variance_factor))
@@ -593,7 +848,7 @@ def get_metrics_summary():
     comments_growth = calculate_growth(total_comments, 0.35)
     shares_growth = calculate_growth(total_shares, 0.3)
 
-    return jsonify({
+    return json_response({
         'metrics': metrics_data,
         'analysis': {
             'total_posts': final_total_posts,
@@ -616,28 +871,9 @@ def get_metrics_summary():
 
 def get_content_status_json():
     """Helper function to get content status as JSON"""
-    linkedin_exists = os.path.exists('outputs/content_calendar.json')
-    twitter_exists = os.path.exists('outputs/twitter_calendar.json')
-    instagram_exists = os.path.exists('outputs/instagram_calendar.json')
-
-    linkedin_count = 0
-    twitter_count = 0
-    instagram_count = 0
-
-    if linkedin_exists:
-        with open('outputs/content_calendar.json', 'r') as f:
-            linkedin_posts = json.load(f)
-            linkedin_count = len(linkedin_posts)
-
-    if twitter_exists:
-        with open('outputs/twitter_calendar.json', 'r') as f:
-            twitter_posts = json.load(f)
-            twitter_count = len(twitter_posts)
-
-    if instagram_exists:
-        with open('outputs/instagram_calendar.json', 'r') as f:
-            instagram_posts = json.load(f)
-            instagram_count = len(instagram_posts)
+    linkedin_count = len(load_calendar('outputs/content_calendar.json'))
+    twitter_count = len(load_calendar('outputs/twitter_calendar.json'))
+    instagram_count = len(load_calendar('outputs/instagram_calendar.json'))
 
     return {
         'linkedin_posts': linkedin_count,
@@ -647,8 +883,9 @@ def get_content_status_json():
     }
 
 @app.route('/api/metrics/top-content')
+@cached_metrics_response
 def get_top_content():
-    return jsonify(db.get_top_content())
+    return json_response(db.get_top_content())
 
 @app.route('/api/topics')
 def get_topics():
@@ -862,9 +1099,8 @@ def generate_content():
 
             # Load existing topics ONLY if no user topic provided
             if not topic and os.path.exists('topics.json'):
-                with open('topics.json', 'r') as f:
-                    existing_topics = json.load(f)
-                    topics_to_use.extend(existing_topics)
+                existing_topics = read_json_file('topics.json')
+                topics_to_use.extend(existing_topics)
                 print(f"DEBUG: Loaded {len(existing_topics)} existing topics")
 
             if not topics_to_use:
@@ -968,15 +1204,15 @@ def generate_content():
             # Use original sequential generator
             def run_generation():
                 if platform == 'linkedin':
-                    result = subprocess.run([
-                        'python3', 'main.py', 'linkedin_batch', str(num_posts)
-                    ], capture_output=True, text=True)
+                    returncode, _ = run_streaming([
+                        sys.executable, 'main.py', 'linkedin_batch', str(num_posts)
+                    ])
                 elif platform == 'twitter':
-                    result = subprocess.run([
-                        'python3', 'main.py', 'twitter_batch'
-                    ], capture_output=True, text=True)
+                    returncode, _ = run_streaming([
+                        sys.executable, 'main.py', 'twitter_batch'
+                    ])
 
-                return result.returncode == 0
+                return returncode == 0
 
             # Start background thread
             thread = threading.Thread(target=run_generation)
@@ -992,14 +1228,11 @@ def generate_content():
     except Exception as e:
         return jsonify({'success': False, 'message': str(e)})
 
-def _get_demo_content(topic, style, platform):
-    """Generate PREMIUM high-quality demo content for immediate demo needs"""
-
-    # Premium Demo content templates - Enhanced Quality
-    demo_templates = {
-        'linkedin': {
-            'educational': [
-                f"""**The {topic} Revolution: Transforming Industries in 2025** 🚀
+# Demo content templates; {topic} and {topic_tag} are filled in for the chosen template only
+DEMO_TEMPLATES = {
+    'linkedin': {
+        'educational': [
+            """**The {topic} Revolution: Transforming Industries in 2025** 🚀
 
 We're witnessing an unprecedented transformation as {topic} reshapes how businesses operate, compete, and deliver value. After analyzing 500+ implementations across 12 industries, here are the game-changing insights every leader needs to know:
 
@@ -1025,10 +1258,10 @@ Start with high-impact, low-complexity use cases that deliver measurable ROI wit
 **CRITICAL QUESTION:**
 What's the one {topic} initiative that could transform your business in the next 90 days? Let's discuss in the comments!
 
-#DigitalTransformation #BusinessInnovation #Leadership #{topic.replace(' ', '')} #FutureOfBusiness"""
-            ],
-            'promotional': [
-                f"""🚀 **EXCLUSIVE: Revolutionary {topic} Platform Delivering 500% ROI for Market Leaders**
+#DigitalTransformation #BusinessInnovation #Leadership #{topic_tag} #FutureOfBusiness"""
+        ],
+        'promotional': [
+            """🚀 **EXCLUSIVE: Revolutionary {topic} Platform Delivering 500% ROI for Market Leaders**
 
 **THE RESULTS ARE IN:** Our groundbreaking {topic} solution is transforming businesses across industries with unprecedented results that speak for themselves:
 
@@ -1066,10 +1299,10 @@ Valued at $25,000, includes:
 
 Ready to join the revolution? DM me "TRANSFORM" or book your exclusive consultation: [Your Link]
 
-#BusinessGrowth #DigitalInnovation #{topic.replace(' ', '')} #MarketLeadership #SuccessStories"""
-            ],
-            'industry_insights': [
-                f"""**🔥 URGENT: {topic} Market Update - 85% of Companies Risk Extinction by 2026**
+#BusinessGrowth #DigitalInnovation #{topic_tag} #MarketLeadership #SuccessStories"""
+        ],
+        'industry_insights': [
+            """**🔥 URGENT: {topic} Market Update - 85% of Companies Risk Extinction by 2026**
 
 **BREAKING INSIGHTS** from our comprehensive analysis of 2,000+ companies reveal a critical tipping point that's reshaping entire industries:
 
@@ -1099,12 +1332,12 @@ Every 6 months of {topic} hesitation equals 18 months of competitive disadvantag
 
 **What's your {topic} strategy for 2025? Share your challenges—I'll provide personalized insights.**
 
-#IndustryDisruption #MarketAnalysis #BusinessStrategy #{topic.replace(' ', '')} #FutureReady"""
-            ]
-        },
-        'twitter': {
-            'educational': [
-                f"""🧵 THREAD: The {topic} Revolution is Here! 🚀
+#IndustryDisruption #MarketAnalysis #BusinessStrategy #{topic_tag} #FutureReady"""
+        ]
+    },
+    'twitter': {
+        'educational': [
+            """🧵 THREAD: The {topic} Revolution is Here! 🚀
 
 1/6: 📊 SHOCKING DATA: 73% of businesses implementing {topic} see 40-80% productivity gains within 6 months. The competitive advantage is REAL.
 
@@ -1118,10 +1351,10 @@ Every 6 months of {topic} hesitation equals 18 months of competitive disadvantag
 
 6/6: 💬 CRITICAL QUESTION: What's the one {topic} initiative that could transform your business in the next 90 days? Drop your thoughts below! 👇
 
-#{topic.replace(' ', '')} #DigitalTransformation #BusinessStrategy #Leadership"""
-            ],
-            'promotional': [
-                f"""🔥 BREAKING: {topic} Platform Delivering 473% Average ROI!
+#{topic_tag} #DigitalTransformation #BusinessStrategy #Leadership"""
+        ],
+        'promotional': [
+            """🔥 BREAKING: {topic} Platform Delivering 473% Average ROI!
 
 📈 UNPRECEDENTED RESULTS:
 • 82% cost reduction
@@ -1141,10 +1374,10 @@ Only 10 spots available this quarter.
 
 Ready to transform? DM me "TRANSFORM" now!
 
-#{topic.replace(' ', '')} #BusinessGrowth #ROI #Innovation"""
-            ],
-            'industry_insights': [
-                f"""⚠️ URGENT: 85% of Companies Risk Extinction by 2026
+#{topic_tag} #BusinessGrowth #ROI #Innovation"""
+        ],
+        'industry_insights': [
+            """⚠️ URGENT: 85% of Companies Risk Extinction by 2026
 
 📊 MIND-BLOWING STATS:
 • {topic} market reaching $4.2T by 2030
@@ -1163,12 +1396,12 @@ The revolution is HERE. Act NOW or risk becoming irrelevant.
 
 Your {topic} strategy for 2025? Let's discuss! 👇
 
-#{topic.replace(' ', '')} #IndustryDisruption #FutureReady #BusinessStrategy"""
-            ]
-        },
-        'instagram': {
-            'educational': [
-                f"""🚀 **{topic} MASTERY GUIDE** 📚
+#{topic_tag} #IndustryDisruption #FutureReady #BusinessStrategy"""
+        ]
+    },
+    'instagram': {
+        'educational': [
+            """🚀 **{topic} MASTERY GUIDE** 📚
 
 💡 **GAME-CHANGING INSIGHTS:**
 
@@ -1193,10 +1426,10 @@ Drop it in the comments! 👇
 
 🔥 Save this post for your business strategy!
 
-#BusinessTips #{topic.replace(' ', '')} #DigitalTransformation #SuccessMindset #Leadership"""
-            ],
-            'promotional': [
-                f"""🔥 **EXCLUSIVE {topic} OPPORTUNITY** 🔥
+#BusinessTips #{topic_tag} #DigitalTransformation #SuccessMindset #Leadership"""
+        ],
+        'promotional': [
+            """🔥 **EXCLUSIVE {topic} OPPORTUNITY** 🔥
 
 📈 **PROVEN TRANSFORMATION:**
 • 473% average ROI
@@ -1220,10 +1453,10 @@ $25,000 implementation package FREE!
 **Ready to transform?**
 DM me "TRANSFORM" for exclusive access!
 
-#{topic.replace(' ', '')} #BusinessGrowth #GameChanger #SuccessStory #LimitedOffer"""
-            ],
-            'industry_insights': [
-                f"""⚠️ **{topic} ALERT: 2025 Decision Point** ⚠️
+#{topic_tag} #BusinessGrowth #GameChanger #SuccessStory #LimitedOffer"""
+        ],
+        'industry_insights': [
+            """⚠️ **{topic} ALERT: 2025 Decision Point** ⚠️
 
 📊 **CRITICAL TIMELINE:**
 • Market: $4.2T by 2030
@@ -1244,18 +1477,21 @@ Act now or risk market extinction
 
 Your move! What's your plan?
 
-#{topic.replace(' ', '')} #Industry2025 #BusinessStrategy #CriticalDecision #FutureReady"""
-            ]
-        }
+#{topic_tag} #Industry2025 #BusinessStrategy #CriticalDecision #FutureReady"""
+        ]
     }
+}
+
 
+def _get_demo_content(topic, style, platform):
+    """Generate PREMIUM high-quality demo content for immediate demo needs"""
     # Get template based on platform and style
-    platform_templates = demo_templates.get(platform, demo_templates['linkedin'])
+    platform_templates = DEMO_TEMPLATES.get(platform, DEMO_TEMPLATES['linkedin'])
     style_templates = platform_templates.get(style, platform_templates['educational'])
 
-    # Return a template from the appropriate category
-    import random
-    return random.choice(style_templates)
+    # Render only the template that was picked
+    template = random.choice(style_templates)
+    return template.replace('{topic_tag}', topic.replace(' ', '')).replace('{topic}', topic)
 
 @app.route('/api/generate/performance', methods=['POST'])
 def get_performance_comparison():
@@ -1290,6 +1526,7 @@ def get_performance_comparison():
 def add_metrics():
     data = request.json
     db.add_metrics(data)
+    invalidate_metrics_cache()
     return jsonify({'success': True})
 
 # Scheduler API endpoints
@@ -1300,7 +1537,7 @@ def get_scheduler_status():
         scheduler = get_scheduler()
         status = scheduler.get_scheduler_status()
 
-        return jsonify({
+        return json_response({
             'success': True,
             'scheduler_running': status['running'],
             'posts_to_check': status['queued_posts'],
@@ -1326,10 +1563,10 @@ def start_scheduler():
     """Start the production scheduler"""
     try:
         def run_scheduler():
-            result = subprocess.run([
-                'python3', 'production_scheduler.py'
-            ], capture_output=True, text=True)
-            return result.returncode == 0
+            returncode, _ = run_streaming([
+                sys.executable, 'production_scheduler.py'
+            ])
+            return returncode == 0
 
         # Start scheduler in background
         thread = threading.Thread(target=run_scheduler, daemon=True)
@@ -1385,14 +1622,11 @@ def get_scheduled_posts():
     """Get scheduled posts from content calendar"""
     try:
         # Load content calendar
-        content_calendar = []
-        if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                content_calendar = json.load(f)
+        content_calendar = load_calendar('outputs/content_calendar.json')
 
         # Get all posts with their statuses (scheduled, completed, deleted)
         scheduled_posts = []
-        current_date = datetime.now().strftime('%Y-%m-%d')
+        current_date = date.today().isoformat()
 
         for post in content_calendar:
             # Include all posts that are scheduled, completed, or deleted
@@ -1446,8 +1680,7 @@ def add_scheduled_post():
         # Load existing content calendar
         content_calendar = []
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                content_calendar = json.load(f)
+            content_calendar = read_json_file('outputs/content_calendar.json')
 
         # Extract date from scheduled_date (assuming format "YYYY-MM-DD HH:MM:SS")
         publish_date = scheduled_date.split(' ')[0] if ' ' in scheduled_date else scheduled_date
@@ -1468,8 +1701,7 @@ def add_scheduled_post():
 
         # Save to file
         os.makedirs('outputs', exist_ok=True)
-        with open('outputs/content_calendar.json', 'w') as f:
-            json.dump(content_calendar, f, indent=2)
+        write_json_file('outputs/content_calendar.json', content_calendar)
 
         return jsonify({
             'success': True,
@@ -1514,8 +1746,7 @@ def get_latest_generated_content():
 
         if platform_files:
             latest_file = os.path.join('outputs', platform_files[0])
-            with open(latest_file, 'r') as f:
-                content = json.load(f)
+            content = read_json_file(latest_file)
             return jsonify({
                 'success': True,
                 'content': content,
@@ -1524,8 +1755,7 @@ def get_latest_generated_content():
             })
         elif fast_files:
             latest_file = os.path.join('outputs', fast_files[0])
-            with open(latest_file, 'r') as f:
-                content = json.load(f)
+            content = read_json_file(latest_file)
             return jsonify({
                 'success': True,
                 'content': content,
@@ -1544,8 +1774,7 @@ def get_latest_generated_content():
         if platform in calendars:
             file_path = calendars[platform]
             if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    content = json.load(f)
+                content = load_calendar(file_path)
                 return jsonify({
                     'success': True,
                     'content': content,
@@ -1562,50 +1791,22 @@ def get_manual_posting_queue():
     """Get today's manual posting queue"""
     try:
         # Check for today's posts
-        today = datetime.now().strftime('%Y-%m-%d')
+        today = date.today().isoformat()
         queue = []
 
-        # Check LinkedIn posts
-        if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                linkedin_posts = json.load(f)
-                today_posts = [p for p in linkedin_posts if p.get('publish_date') == today]
-                for post in today_posts:
-                    queue.append({
-                        'platform': 'linkedin',
-                        'topic': post.get('topic'),
-                        'content': post.get('content', '')[:100] + '...',
-                        'status': post.get('status', 'ready'),
-                        'optimal_time': '9:00 AM'
-                    })
-
-        # Check Twitter posts
-        if os.path.exists('outputs/twitter_calendar.json'):
-            with open('outputs/twitter_calendar.json', 'r') as f:
-                twitter_posts = json.load(f)
-                today_threads = [t for t in twitter_posts if t.get('publish_date') == today]
-                for thread in today_threads:
-                    queue.append({
-                        'platform': 'twitter',
-                        'topic': thread.get('topic'),
-                        'content': f"Thread with {len(thread.get('tweets', []))} tweets",
-                        'status': thread.get('status', 'ready'),
-                        'optimal_time': '2:00 PM'
-                    })
-
-        # Check Instagram posts
-        if os.path.exists('outputs/instagram_calendar.json'):
-            with open('outputs/instagram_calendar.json', 'r') as f:
-                instagram_posts = json.load(f)
-                today_posts = [p for p in instagram_posts if p.get('publish_date') == today]
-                for post in today_posts:
-                    queue.append({
-                        'platform': 'instagram',
-                        'topic': post.get('topic'),
-                        'content': post.get('content', '')[:100] + '...',
-                        'status': post.get('status', 'ready'),
-                        'optimal_time': '6:00 PM'
-                    })
+        for platform, path, optimal_time in MANUAL_QUEUE_SOURCES:
+            for post in calendar_posts_for_date(path, today):
+                if platform == 'twitter':
+                    content = f"Thread with {len(post.get('tweets', []))} tweets"
+                else:
+                    content = post.get('content', '')[:100] + '...'
+                queue.append({
+                    'platform': platform,
+                    'topic': post.get('topic'),
+                    'content': content,
+                    'status': post.get('status', 'ready'),
+                    'optimal_time': optimal_time
+                })
 
         return jsonify({'queue': queue, 'total': len(queue)})
     except Exception as e:
@@ -1640,21 +1841,19 @@ def generate_bulk_posts(platform):
 
         # Run production-ready bulk generation
         if platform == 'linkedin':
-            cmd = ['python', 'main.py', 'linkedin_batch']
+            cmd = [sys.executable, 'main.py', 'linkedin_batch']
         elif platform == 'instagram':
-            cmd = ['python', 'main.py', 'instagram_batch']
+            cmd = [sys.executable, 'main.py', 'instagram_batch']
         elif platform == 'twitter':
-            cmd = ['python', 'main.py', 'twitter_batch']
-
-        # Execute the command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+            cmd = [sys.executable, 'main.py', 'twitter_batch']
+
+        # Execute the command, streaming its output to the server log.
+        # run_streaming passes close_fds=False and cmd uses an absolute
+        # interpreter path, so CPython can use posix_spawn() instead of
+        # fork+exec; fds opened by Python are non-inheritable by default.
+        returncode, output_tail = run_streaming(cmd, timeout=300)  # 5 minute timeout
 
-        if result.returncode == 0:
+        if returncode == 0:
             # Count generated posts
             generated_count = 0
 
@@ -1665,10 +1864,9 @@ def generate_bulk_posts(platform):
 
             for output_file in output_files:
                 try:
-                    with open(output_file, 'r') as f:
-                        content_data = json.load(f)
-                        if isinstance(content_data, list):
-                            generated_count += len(content_data)
+                    content_data = read_json_file(output_file)
+                    if isinstance(content_data, list):
+                        generated_count += len(content_data)
                 except:
                     continue
 
@@ -1681,7 +1879,7 @@ def generate_bulk_posts(platform):
         else:
             return jsonify({
                 'success': False,
-                'error': f'Bulk generation failed: {result.stderr}'
+                'error': f'Bulk generation failed: {output_tail}'
             })
 
     except subprocess.TimeoutExpired:
@@ -1715,18 +1913,15 @@ def get_generated_posts(platform):
         scheduled_posts = set()
         scheduled_topics = set()
         try:
-            if os.path.exists('outputs/content_calendar.json'):
-                with open('outputs/content_calendar.json', 'r') as f:
-                    content_calendar = json.load(f)
-                    for post in content_calendar:
-                        if post.get('status') == 'scheduled':
-                            # Add multiple identifiers to ensure proper filtering
-                            scheduled_posts.add(post.get('post_number', 0))
-                            scheduled_posts.add(post.get('id', 0))
-                            scheduled_posts.add(f"{post.get('platform', '')}_{post.get('post_number', 0)}")
-                            # Also exclude by topic to catch personal presentations
-                            if post.get('topic'):
-                                scheduled_topics.add(post.get('topic').lower().strip())
+            for post in load_calendar('outputs/content_calendar.json'):
+                if post.get('status') == 'scheduled':
+                    # Add multiple identifiers to ensure proper filtering
+                    scheduled_posts.add(post.get('post_number', 0))
+                    scheduled_posts.add(post.get('id', 0))
+                    scheduled_posts.add(f"{post.get('platform', '')}_{post.get('post_number', 0)}")
+                    # Also exclude by topic to catch personal presentations
+                    if post.get('topic'):
+                        scheduled_topics.add(post.get('topic').lower().strip())
         except Exception as e:
             print(f"Error loading scheduled posts for filtering: {e}")
 
@@ -1798,21 +1993,20 @@ def get_generated_posts(platform):
 
             for output_file in output_files:
                 try:
-                    with open(output_file, 'r') as f:
-                        content_data = json.load(f)
-                        if isinstance(content_data, list):
-                            for post in content_data:
-                                # Skip scheduled posts in JSON files as well
-                                if post.get('status') == 'scheduled':
-                                    continue
-
-                                # Create a unique key based on content (first 200 characters)
-                                content_key = post.get('content', '')[:200].strip()
-
-                                # Only add if we haven't seen this content before
-                                if content_key and content_key not in seen_content:
-                                    seen_content.add(content_key)
-                                    all_posts.append(post)
+                    content_data = read_json_file(output_file)
+                    if isinstance(content_data, list):
+                        for post in content_data:
+                            # Skip scheduled posts in JSON files as well
+                            if post.get('status') == 'scheduled':
+                                continue
+
+                            # Create a unique key based on content (first 200 characters)
+                            content_key = post.get('content', '')[:200].strip()
+
+                            # Only add if we haven't seen this content before
+                            if content_key and content_key not in seen_content:
+                                seen_content.add(content_key)
+                                all_posts.append(post)
                 except:
                     continue
 
@@ -1854,29 +2048,27 @@ def get_today_posts():
     """Get posts for manual posting workflow"""
     try:
         posts = []
-        today = datetime.now().strftime('%Y-%m-%d')
+        today = date.today().isoformat()
 
         # Load from todays_posts.json first
-        if os.path.exists('outputs/todays_posts.json'):
-            with open('outputs/todays_posts.json', 'r') as f:
-                todays_posts = json.load(f)
-
-                # Process posts, filtering for recent and relevant ones (EXCLUDING scheduled posts)
-                for post in todays_posts:
-                    # Include posts that are generated or published recently, but EXCLUDE scheduled posts
-                    if (post.get('status') in ['generated', 'published'] and
-                        post.get('status') != 'scheduled' and
-                        post.get('scheduled_date') != today):
-                        posts.append({
-                            'id': post.get('id', post.get('id', str(len(posts) + 1))),
-                            'topic': post.get('topic', 'No topic'),
-                            'content': post.get('content', ''),
-                            'platform': post.get('platform', 'linkedin'),
-                            'hashtags': post.get('hashtags', ''),
-                            'scheduled_time': post.get('scheduled_time', ''),
-                            'status': post.get('status', 'generated'),
-                            'created_at': post.get('created_at', datetime.now().isoformat())
-                        })
+        todays_posts = load_calendar('outputs/todays_posts.json')
+
+        # Process posts, filtering for recent and relevant ones (EXCLUDING scheduled posts)
+        for post in todays_posts:
+            # Include posts that are generated or published recently, but EXCLUDE scheduled posts
+            if (post.get('status') in ['generated', 'published'] and
+                post.get('status') != 'scheduled' and
+                post.get('scheduled_date') != today):
+                posts.append({
+                    'id': post.get('id', post.get('id', str(len(posts) + 1))),
+                    'topic': post.get('topic', 'No topic'),
+                    'content': post.get('content', ''),
+                    'platform': post.get('platform', 'linkedin'),
+                    'hashtags': post.get('hashtags', ''),
+                    'scheduled_time': post.get('scheduled_time', ''),
+                    'status': post.get('status', 'generated'),
+                    'created_at': post.get('created_at', datetime.now().isoformat())
+                })
 
         # Also get recent fast generated posts to ensure we have content
         import glob
@@ -1889,23 +2081,22 @@ def get_today_posts():
 
             for file in files[:1]:  # Only get the most recent file
                 try:
-                    with open(file, 'r') as f:
-                        data = json.load(f)
-                        if isinstance(data, list):
-                            for item in data[:2]:  # Limit to prevent too many posts
-                                # Avoid duplicates by checking if topic already exists
-                                topic_exists = any(p.get('topic') == item.get('topic') for p in posts)
-                                if not topic_exists:
-                                    posts.append({
-                                        'id': item.get('id', f"{platform}_{len(posts)}"),
-                                        'topic': item.get('topic', 'AI-generated topic'),
-                                        'content': item.get('content', ''),
-                                        'platform': platform,
-                                        'hashtags': item.get('hashtags', ''),
-                                        'scheduled_time': item.get('scheduled_time', datetime.now().strftime('%H:%M')),
-                                        'status': 'generated',
-                                        'created_at': item.get('created_at', datetime.now().isoformat())
-                                    })
+                    data = load_calendar(file)
+                    if isinstance(data, list):
+                        for item in data[:2]:  # Limit to prevent too many posts
+                            # Avoid duplicates by checking if topic already exists
+                            topic_exists = any(p.get('topic') == item.get('topic') for p in posts)
+                            if not topic_exists:
+                                posts.append({
+                                    'id': item.get('id', f"{platform}_{len(posts)}"),
+                                    'topic': item.get('topic', 'AI-generated topic'),
+                                    'content': item.get('content', ''),
+                                    'platform': platform,
+                                    'hashtags': item.get('hashtags', ''),
+                                    'scheduled_time': item.get('scheduled_time', datetime.now().strftime('%H:%M')),
+                                    'status': 'generated',
+                                    'created_at': item.get('created_at', datetime.now().isoformat())
+                                })
                 except:
                     continue
 
@@ -1948,28 +2139,22 @@ def mark_post_published():
     try:
         data = request.get_json()
         post_id = data.get('post_id')
-
-        # Update status in content calendar if it exists
-        if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                calendar_data = json.load(f)
-
-            updated = False
-            if isinstance(calendar_data, list):
-                for item in calendar_data:
-                    if item.get('id') == post_id:
+        post_ids = set(data.get('post_ids') or [post_id])
+
+        # Update status in content calendar, writing it back once for the whole batch
+        with edit_calendar('outputs/content_calendar.json') as edit:
+            if isinstance(edit.items, list):
+                published_at = datetime.now().isoformat()
+                for item in edit.items:
+                    if item.get('id') in post_ids:
                         item['status'] = 'published'
-                        item['published_at'] = datetime.now().isoformat()
-                        updated = True
-                        break
-
-            if updated:
-                with open('outputs/content_calendar.json', 'w') as f:
-                    json.dump(calendar_data, f, indent=2)
+                        item['published_at'] = published_at
+                        edit.changed = True
 
         return jsonify({
             'success': True,
-            'message': f'Post {post_id} marked as published'
+            'message': f'Post {post_id} marked as published' if post_id is not None
+                       else f'{len(post_ids)} posts marked as published'
         })
 
     except Exception as e:
@@ -1984,29 +2169,21 @@ def mark_post_pending():
     try:
         data = request.get_json()
         post_id = data.get('post_id')
+        post_ids = set(data.get('post_ids') or [post_id])
 
-        # Update status in content calendar if it exists
-        if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                calendar_data = json.load(f)
-
-            updated = False
-            if isinstance(calendar_data, list):
-                for item in calendar_data:
-                    if item.get('id') == post_id:
+        # Update status in content calendar, writing it back once for the whole batch
+        with edit_calendar('outputs/content_calendar.json') as edit:
+            if isinstance(edit.items, list):
+                for item in edit.items:
+                    if item.get('id') in post_ids:
                         item['status'] = 'generated'
-                        if 'published_at' in item:
-                            del item['published_at']
-                        updated = True
-                        break
-
-            if updated:
-                with open('outputs/content_calendar.json', 'w') as f:
-                    json.dump(calendar_data, f, indent=2)
+                        item.pop('published_at', None)
+                        edit.changed = True
 
         return jsonify({
             'success': True,
-            'message': f'Post {post_id} marked as pending'
+            'message': f'Post {post_id} marked as pending' if post_id is not None
+                       else f'{len(post_ids)} posts marked as pending'
         })
 
     except Exception as e:
@@ -2021,8 +2198,7 @@ def delete_scheduled_post(post_id):
     try:
         # Load content calendar
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                content_calendar = json.load(f)
+            content_calendar = read_json_file('outputs/content_calendar.json')
         else:
             return jsonify({
                 'success': False,
@@ -2040,8 +2216,7 @@ def delete_scheduled_post(post_id):
 
         if post_found:
             # Save updated calendar
-            with open('outputs/content_calendar.json', 'w') as f:
-                json.dump(content_calendar, f, indent=2)
+            write_json_file('outputs/content_calendar.json', content_calendar)
 
             return jsonify({
                 'success': True,
@@ -2065,8 +2240,7 @@ def complete_scheduled_post(post_id):
     try:
         # Load content calendar
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                content_calendar = json.load(f)
+            content_calendar = read_json_file('outputs/content_calendar.json')
         else:
             return jsonify({
                 'success': False,
@@ -2084,8 +2258,7 @@ def complete_scheduled_post(post_id):
 
         if post_found:
             # Save updated calendar
-            with open('outputs/content_calendar.json', 'w') as f:
-                json.dump(content_calendar, f, indent=2)
+            write_json_file('outputs/content_calendar.json', content_calendar)
 
             return jsonify({
                 'success': True,
@@ -2109,8 +2282,7 @@ def uncomplete_scheduled_post(post_id):
     try:
         # Load content calendar
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                content_calendar = json.load(f)
+            content_calendar = read_json_file('outputs/content_calendar.json')
         else:
             return jsonify({
                 'success': False,
@@ -2130,8 +2302,7 @@ def uncomplete_scheduled_post(post_id):
 
         if post_found:
             # Save updated calendar
-            with open('outputs/content_calendar.json', 'w') as f:
-                json.dump(content_calendar, f, indent=2)
+            write_json_file('outputs/content_calendar.json', content_calendar)
 
             return jsonify({
                 'success': True,
@@ -2288,16 +2459,14 @@ def get_post_for_edit(post_id):
 
         # Check in content calendar first
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                calendar_data = json.load(f)
-                if isinstance(calendar_data, list):
-                    post = next((item for item in calendar_data if item.get('id') == post_id), None)
+            calendar_data = read_json_file('outputs/content_calendar.json')
+            if isinstance(calendar_data, list):
+                post = next((item for item in calendar_data if item.get('id') == post_id), None)
 
         # Check in todays_posts.json if not found
         if not post and os.path.exists('outputs/todays_posts.json'):
-            with open('outputs/todays_posts.json', 'r') as f:
-                todays_posts = json.load(f)
-                post = next((item for item in todays_posts if item.get('id') == post_id), None)
+            todays_posts = read_json_file('outputs/todays_posts.json')
+            post = next((item for item in todays_posts if item.get('id') == post_id), None)
 
         # Check in fast generated files
         if not post:
@@ -2307,12 +2476,11 @@ def get_post_for_edit(post_id):
                 files = glob.glob(pattern)
                 for file in files:
                     try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                            if isinstance(data, list):
-                                post = next((item for item in data if item.get('id') == post_id), None)
-                                if post:
-                                    break
+                        data = read_json_file(file)
+                        if isinstance(data, list):
+                            post = next((item for item in data if item.get('id') == post_id), None)
+                            if post:
+                                break
                     except:
                         continue
                     if post:
@@ -2350,8 +2518,7 @@ def update_post(post_id):
 
         # Update in content calendar
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                calendar_data = json.load(f)
+            calendar_data = read_json_file('outputs/content_calendar.json')
 
             if isinstance(calendar_data, list):
                 for item in calendar_data:
@@ -2367,13 +2534,11 @@ def update_post(post_id):
                         break
 
             if updated:
-                with open('outputs/content_calendar.json', 'w') as f:
-                    json.dump(calendar_data, f, indent=2)
+                write_json_file('outputs/content_calendar.json', calendar_data)
 
         # Update in todays_posts.json
         if os.path.exists('outputs/todays_posts.json'):
-            with open('outputs/todays_posts.json', 'r') as f:
-                todays_posts = json.load(f)
+            todays_posts = read_json_file('outputs/todays_posts.json')
 
             if isinstance(todays_posts, list):
                 for item in todays_posts:
@@ -2389,8 +2554,7 @@ def update_post(post_id):
                         break
 
             if updated:
-                with open('outputs/todays_posts.json', 'w') as f:
-                    json.dump(todays_posts, f, indent=2)
+                write_json_file('outputs/todays_posts.json', todays_posts)
 
         # Update in fast generated files
         if not updated:
@@ -2400,8 +2564,7 @@ def update_post(post_id):
                 files = glob.glob(pattern)
                 for file in files:
                     try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
+                        data = read_json_file(file)
 
                         if isinstance(data, list):
                             for item in data:
@@ -2417,8 +2580,7 @@ def update_post(post_id):
                                     break
 
                         if updated:
-                            with open(file, 'w') as f:
-                                json.dump(data, f, indent=2)
+                            write_json_file(file, data)
                             break
                     except:
                         continue
@@ -2477,8 +2639,7 @@ def delete_post(post_id):
 
         # Remove from content calendar
         if os.path.exists('outputs/content_calendar.json'):
-            with open('outputs/content_calendar.json', 'r') as f:
-                calendar_data = json.load(f)
+            calendar_data = read_json_file('outputs/content_calendar.json')
 
             if isinstance(calendar_data, list):
                 original_length = len(calendar_data)
@@ -2486,13 +2647,11 @@ def delete_post(post_id):
 
                 if len(calendar_data) < original_length:
                     deleted = True
-                    with open('outputs/content_calendar.json', 'w') as f:
-                        json.dump(calendar_data, f, indent=2)
+                    write_json_file('outputs/content_calendar.json', calendar_data)
 
         # Remove from todays_posts.json
         if os.path.exists('outputs/todays_posts.json'):
-            with open('outputs/todays_posts.json', 'r') as f:
-                todays_posts = json.load(f)
+            todays_posts = read_json_file('outputs/todays_posts.json')
 
             if isinstance(todays_posts, list):
                 original_length = len(todays_posts)
@@ -2500,8 +2659,7 @@ def delete_post(post_id):
 
                 if len(todays_posts) < original_length:
                     deleted = True
-                    with open('outputs/todays_posts.json', 'w') as f:
-                        json.dump(todays_posts, f, indent=2)
+                    write_json_file('outputs/todays_posts.json', todays_posts)
 
         # Remove from fast generated files
         if not deleted:
@@ -2511,8 +2669,7 @@ def delete_post(post_id):
                 files = glob.glob(pattern)
                 for file in files:
                     try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
+                        data = read_json_file(file)
 
                         if isinstance(data, list):
                             original_length = len(data)
@@ -2520,8 +2677,7 @@ def delete_post(post_id):
 
                             if len(data) < original_length:
                                 deleted = True
-                                with open(file, 'w') as f:
-                                    json.dump(data, f, indent=2)
+                                write_json_file(file, data)
                                 break
                     except:
                         continue
@@ -2596,8 +2752,7 @@ def save_post(post_id):
                 files = glob.glob(pattern)
                 for file in files:
                     try:
-                        with open(file, 'r') as f:
-                            file_data = json.load(f)
+                        file_data = read_json_file(file)
 
                         if isinstance(file_data, list):
                             file_updated = False
@@ -2609,8 +2764,7 @@ def save_post(post_id):
                                     file_updated = True
 
                             if file_updated:
-                                with open(file, 'w') as f:
-                                    json.dump(file_data, f, indent=2)
+                                write_json_file(file, file_data)
                                 print(f"Updated post {post_id} in {file}")
                                 break
                     except:
@@ -2773,9 +2927,9 @@ def import_instagram_csv():
         result = instagram_integration.import_csv(csv_file_path)
 
         if result['success']:
-            # Save metrics to database
-            for metric in result['data']:
-                db.add_metrics(metric)
+            # Save metrics to database in one transaction
+            db.add_metrics_batch(result['data'])
+            invalidate_metrics_cache()
 
         return jsonify(result)
 
@@ -2852,4 +3006,5 @@ if __name__ == '__main__':
     print("🚀 Full-Stack Metrics Dashboard Starting...")
     print("📊 Features: Topics, Content Generation, Analytics")
     print("🌐 Open: http://localhost:5000")
+    threading.Thread(target=prefetch_calendars, daemon=True).start()
     app.run(debug=True, host='0.0.0.0', port=5000)
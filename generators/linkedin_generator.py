@@ -8,6 +8,9 @@ from core import config
 
 logger = logging.getLogger(__name__)
 
+# Emit a progress line every N items instead of once per item
+PROGRESS_LOG_EVERY = 10
+
 class LinkedInGenerator:
     def __init__(self):
         self.topics_file = config.TOPICS_FILE
@@ -57,7 +60,8 @@ class LinkedInGenerator:
                 'publish_date': publish_date.strftime('%Y-%m-%d'),
                 'status': 'draft'
             })
-            logger.info(f"Generated post {i+1}/{len(topics_data)} for topic: {topic[:30]}...")
+            if (i + 1) % PROGRESS_LOG_EVERY == 0 or i + 1 == len(topics_data):
+                logger.info(f"Generated post {i+1}/{len(topics_data)} (latest topic: {topic[:30]}...)")
 
         linkedin_output_file_path = os.path.join(self.output_dir, config.LINKEDIN_OUTPUT_FILE)
 
@@ -8,6 +8,9 @@ from core import config
 
 logger = logging.getLogger(__name__)
 
+# Emit a progress line every N items instead of once per item
+PROGRESS_LOG_EVERY = 10
+
 class TwitterThreadGenerator:
     def __init__(self):
         self.output_dir = config.OUTPUT_DIR
@@ -48,7 +51,8 @@ class TwitterThreadGenerator:
                 'publish_date': publish_date.strftime('%Y-%m-%d'),
                 'status': 'draft'
             })
-            logger.info(f"Generated thread {i+1}/{len(linkedin_calendar)} for topic: {topic[:30]}...")
+            if (i + 1) % PROGRESS_LOG_EVERY == 0 or i + 1 == len(linkedin_calendar):
+                logger.info(f"Generated thread {i+1}/{len(linkedin_calendar)} (latest topic: {topic[:30]}...)")
 
         twitter_output_file_path = os.path.join(self.output_dir, config.TWITTER_OUTPUT_FILE)
 
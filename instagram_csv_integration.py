@@ -50,10 +50,15 @@ class InstagramCSVIntegration:
             with open(csv_file_path, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
                 for row in reader:
+                    likes = int(row.get('Likes', 0))
+                    comments = int(row.get('Comments', 0))
+                    shares = int(row.get('Shares', 0))
+                    reach = int(row.get('Reach', 0))
+
                     # Calculate engagement rate
-                    total_engagement = int(row.get('Likes', 0)) + int(row.get('Comments', 0)) + int(row.get('Shares', 0))
-                    reach = int(row.get('Reach', 1))
-                    engagement_rate = (total_engagement / reach) * 100 if reach > 0 else 0
+                    total_engagement = likes + comments + shares
+                    rate_reach = reach if 'Reach' in row else 1
+                    engagement_rate = (total_engagement / rate_reach) * 100 if rate_reach > 0 else 0
 
                     metrics_data.append({
                         'date': row.get('Date', ''),
@@ -61,11 +66,11 @@ class InstagramCSVIntegration:
                         'post_url': row.get('Post_URL', ''),
                         'image_url': row.get('Image_URL', ''),
                         'caption': row.get('Caption', '')[:200],  # Truncate for display
-                        'likes': int(row.get('Likes', 0)),
-                        'comments': int(row.get('Comments', 0)),
-                        'shares': int(row.get('Shares', 0)),
+                        'likes': likes,
+                        'comments': comments,
+                        'shares': shares,
                         'saves': int(row.get('Saves', 0)),
-                        'reach': int(row.get('Reach', 0)),
+                        'reach': reach,
                         'impressions': int(row.get('Impressions', 0)),
                         'engagement_rate': round(engagement_rate, 2),
                         'total_engagement': total_engagement
@@ -7,12 +7,24 @@ import requests
 import json
 import time
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, Optional, Any
 import logging
 
 class LinkedInRealAPI:
     """Real LinkedIn API client for fetching actual analytics data"""
 
+    # Endpoint templates and query params shared by every instance
+    _ORG_URLS = (
+        "https://api.linkedin.com/v2/organizations/{}",
+        "https://api.linkedin.com/v2/organizations?q=ids&ids={}"
+    )
+    _ORG_FIELDS = MappingProxyType({'fields': 'id,name,followerCount'})
+    _POST_FIELDS = MappingProxyType({
+        'q': 'authors',
+        'fields': 'id,text,createdAt,likes,comments,shares,numImpressions,totalShares,totalComments'
+    })
+
     def __init__(self):
         self.base_url = "https://api.linkedin.com/v2"
         self.base_url_ugc = "https://api.linkedin.com/v2/ugcPosts"
@@ -139,14 +151,10 @@ class LinkedInRealAPI:
         """Try to access organization data - handle 403 gracefully"""
         try:
             # Try different LinkedIn organization endpoints
-            endpoints = [
-                f"https://api.linkedin.com/v2/organizations/{company_id}",
-                f"https://api.linkedin.com/v2/organizations?q=ids&ids={company_id}"
-            ]
-
-            for url in endpoints:
+            for template in self._ORG_URLS:
+                url = template.format(company_id)
                 try:
-                    response = self.session.get(url, params={'fields': 'id,name,followerCount'})
+                    response = self.session.get(url, params=self._ORG_FIELDS)
 
                     if response.status_code == 200:
                         return response.json()
@@ -192,15 +200,13 @@ class LinkedInRealAPI:
         """Fetch recent company posts"""
         try:
             # Get organization posts
-            url = f"{self.base_url_ugc}"
             params = {
-                'q': 'authors',
+                **self._POST_FIELDS,
                 'authors': f'urn:li:organization:{company_id}',
-                'count': limit,
-                'fields': 'id,text,createdAt,likes,comments,shares,numImpressions,totalShares,totalComments'
+                'count': limit
             }
 
-            response = self.session.get(url, params=params)
+            response = self.session.get(self.base_url_ugc, params=params)
 
             if response.status_code == 200:
                 return response.json()
@@ -4,9 +4,57 @@ Migrate existing posts from JSON files to database
 """
 import json
 import sqlite3
-import glob
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+MIGRATION_WORKERS = 8
+MIGRATION_CHUNK_SIZE = 5000
+
+def _load_json(path):
+    """Read and decode one JSON file, returning (path, data, error) so a bad file doesn't stop the pool"""
+    try:
+        with open(path, 'rb') as f:
+            raw = f.read()
+        return path, (orjson.loads(raw) if orjson else json.loads(raw)), None
+    except Exception as e:
+        return path, None, e
+
+def _sqlite_value(value):
+    """Return value unchanged if SQLite can bind it, else its JSON text so one odd field can't abort a chunk"""
+    if isinstance(value, int) and not -2**63 <= value < 2**63:
+        return str(value)  # Outside SQLite's 64-bit INTEGER range
+    if value is None or isinstance(value, (str, int, float, bytes)):
+        return value
+    return json.dumps(value, default=str)
+
+def _iter_loaded(pool, paths):
+    """Yield _load_json results in path order, keeping at most MIGRATION_WORKERS files in flight"""
+    pending = deque()
+    for path in paths:
+        pending.append(pool.submit(_load_json, path))
+        if len(pending) >= MIGRATION_WORKERS:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+def _insert_chunk(cursor, rows, first_number):
+    """Write one chunk of rows, numbering posts without an id from first_number"""
+    cursor.executemany('''
+        INSERT OR REPLACE INTO generated_content
+        (platform, content, topic, post_id, generated_at, posted)
+        VALUES (?, ?, ?, ?, ?, ?)
+    ''', [
+        (platform, content, topic, post_id or f"{platform}_{first_number + i}", generated_at, posted)
+        for i, (platform, content, topic, post_id, generated_at, posted) in enumerate(rows)
+    ])
 
 def migrate_posts_to_database():
     """Migrate posts from JSON files to the database"""
@@ -14,6 +62,8 @@ def migrate_posts_to_database():
 
     # Connect to database
     conn = sqlite3.connect(db_path)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
     cursor = conn.cursor()
 
     # Count existing posts in database
@@ -22,55 +72,60 @@ def migrate_posts_to_database():
     print(f"Existing posts in database: {existing_count}")
 
     posts_migrated = 0
+    batch = []
 
-    # Migrate from all JSON files in outputs directory
-    json_files = glob.glob('outputs/*.json')
-
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+    # Insert or replace everything in a single transaction, flushed in fixed-size chunks
+    cursor.execute('BEGIN IMMEDIATE')
 
+    # Migrate from all JSON files in outputs directory
+    json_files = (str(path) for path in Path('outputs').glob('*.json'))
+
+    # Files are read and decoded in parallel, a bounded window at a time, in glob order
+    with ThreadPoolExecutor(max_workers=MIGRATION_WORKERS) as pool:
+        for json_file, data, error in _iter_loaded(pool, json_files):
+            if error is not None:
+                print(f"Error processing {json_file}: {error}")
+                continue
+
+            # Determine platform from filename once; post data can override it
+            filename = os.path.basename(json_file).lower()
+            if 'twitter' in filename:
+                file_platform = 'twitter'
+            elif 'instagram' in filename:
+                file_platform = 'instagram'
+            else:
+                file_platform = 'linkedin'  # default
+
+            try:
+                # Build this file's rows first so a bad post skips only its own file
+                file_rows = []
                 if isinstance(data, list):
                     for post in data:
                         if post.get('content') and post.get('content').strip():
-                            # Determine platform from filename or post data
-                            platform = 'linkedin'  # default
-                            filename = os.path.basename(json_file).lower()
-                            if 'twitter' in filename:
-                                platform = 'twitter'
-                            elif 'instagram' in filename:
-                                platform = 'instagram'
-                            elif 'linkedin' in filename:
-                                platform = 'linkedin'
-
-                            if post.get('platform'):
-                                platform = post['platform']
-
-                            # Generate post_id if not exists
-                            post_id = post.get('id') or f"{platform}_{posts_migrated + existing_count + 1}"
-
-                            # Insert or replace in database
-                            cursor.execute('''
-                                INSERT OR REPLACE INTO generated_content
-                                (platform, content, topic, post_id, generated_at, posted)
-                                VALUES (?, ?, ?, ?, ?, ?)
-                            ''', (
+                            platform = post.get('platform') or file_platform
+
+                            file_rows.append(tuple(_sqlite_value(value) for value in (
                                 platform,
                                 post.get('content', ''),
                                 post.get('topic', 'No topic'),
-                                post_id,
+                                post.get('id'),
                                 post.get('created_at', post.get('generated_at', datetime.now().isoformat())),
                                 post.get('status') == 'published' or post.get('posted', False)
-                            ))
+                            )))
 
-                            posts_migrated += 1
+            except Exception as e:
+                print(f"Error processing {json_file}: {e}")
+                continue
 
-        except Exception as e:
-            print(f"Error processing {json_file}: {e}")
-            continue
+            batch.extend(file_rows)
+            if len(batch) >= MIGRATION_CHUNK_SIZE:
+                _insert_chunk(cursor, batch, posts_migrated + existing_count + 1)
+                posts_migrated += len(batch)
+                batch = []
 
-    # Commit changes
+    # Posts without an id are numbered after the existing rows
+    _insert_chunk(cursor, batch, posts_migrated + existing_count + 1)
+    posts_migrated += len(batch)
     conn.commit()
 
     # Get final count
@@ -5,12 +5,17 @@ Secure API credential management and authentication flow
 """
 
 import os
+import atexit
 import secrets
+import threading
+import time
 import hashlib
 import sqlite3
 import json
 import requests
 import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
@@ -18,8 +23,23 @@ from dataclasses import dataclass
 from flask import request, session, redirect, url_for
 import logging
 
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCMSIV
+    from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+except ImportError:
+    AESGCMSIV = None
+
 logger = logging.getLogger(__name__)
 
+# Stored secrets are base64(version || nonce || ciphertext)
+ENCRYPTION_VERSION = b'\x01'
+NONCE_SIZE = 12
+
+STATE_TOKEN_TTL = 600  # seconds
+HTTP_TIMEOUT = (3, 10)  # connect, read seconds
+
 @dataclass
 class OAuthCredentials:
     """OAuth credentials data structure"""
@@ -34,11 +54,33 @@ class OAuthCredentials:
     account_id: Optional[str] = None
     account_type: Optional[str] = None  # 'company' or 'personal' for LinkedIn, 'user' for Twitter
 
+def _now_iso(offset: timedelta = timedelta()) -> str:
+    """Timestamps are stored as ISO-8601 text so reads can return them unchanged"""
+    return (datetime.now() + offset).isoformat(timespec='seconds')
+
 class OAuthManager:
     """OAuth 2.0 Manager for LinkedIn and Twitter"""
 
+    # Query-string parts that never change between authorization requests
+    _LINKEDIN_AUTH_STATIC = urllib.parse.urlencode({
+        'response_type': 'code',
+        'scope': 'openid profile r_liteprofile r_emailaddress w_member_social'
+    })
+    _TWITTER_AUTH_STATIC = urllib.parse.urlencode({
+        'response_type': 'code',
+        'code_challenge_method': 'S256',
+        'scope': 'tweet.read users.read offline.access'
+    })
+
     def __init__(self, db_path: str = 'data/social_credentials.db'):
         self.db_path = db_path
+        self._aead = self._build_cipher()
+        self.http = self._build_http_session()
+        self._local = threading.local()
+        self._connections = []
+        self._connections_lock = threading.Lock()
+        self._basic_auth_headers = {}  # platform -> HTTP Basic header, built when credentials are set up
+        atexit.register(self.close)
         self.init_database()
 
         # OAuth endpoints
@@ -48,11 +90,40 @@ class OAuthManager:
         self.twitter_auth_url = "https://twitter.com/i/oauth2/authorize"
         self.twitter_token_url = "https://api.twitter.com/2/oauth2/token"
 
+    def _conn(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA temp_store=MEMORY')
+            conn.execute('PRAGMA mmap_size=134217728')
+            conn.execute('PRAGMA cache_size=-8000')
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self):
+        """Close every database and HTTP connection opened by this manager"""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        self._basic_auth_headers.clear()
+        self.http.close()
+
     def init_database(self):
         """Initialize secure database for OAuth credentials"""
         os.makedirs('data', exist_ok=True)
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
+            # WAL is persistent on the database file: readers no longer block behind writers
+            journal_mode = conn.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+            if journal_mode != 'wal':
+                logger.warning(f"Could not enable WAL for {self.db_path} (journal_mode={journal_mode})")
+
             conn.executescript('''
                 CREATE TABLE IF NOT EXISTS oauth_credentials (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -80,31 +151,86 @@ class OAuthManager:
                 );
 
                 CREATE INDEX IF NOT EXISTS idx_platform ON oauth_credentials(platform);
-                CREATE INDEX IF NOT EXISTS idx_state ON oauth_states(state_token);
+
+                -- State lookups are answered from the index alone; expires_at is unix seconds
+                DROP INDEX IF EXISTS idx_state;
+                CREATE INDEX IF NOT EXISTS idx_state_cov ON oauth_states(state_token, expires_at, platform);
+                DELETE FROM oauth_states WHERE typeof(expires_at) != 'integer';
+
+                -- Normalize timestamps written by the old datetime adapter to ISO-8601
+                UPDATE oauth_credentials SET expires_at = replace(substr(expires_at, 1, 19), ' ', 'T')
+                WHERE expires_at LIKE '____-__-__ %';
+                UPDATE oauth_credentials SET updated_at = replace(substr(updated_at, 1, 19), ' ', 'T')
+                WHERE updated_at LIKE '____-__-__ %';
             ''')
+            self._sweep_states(conn)
+
+    @staticmethod
+    def _build_http_session() -> requests.Session:
+        """Keep-alive session shared by token exchanges and profile fetches"""
+        http = requests.Session()
+        # urllib3 only retries idempotent methods, so single-use auth codes are never re-POSTed
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+        )
+        http.mount('https://', adapter)
+        return http
+
+    @staticmethod
+    def _build_cipher():
+        """Derive the AES-256-GCM-SIV key from OAUTH_SECRET_KEY once per manager"""
+        if AESGCMSIV is None:
+            logger.warning("cryptography not installed - OAuth secrets cannot be stored")
+            return None
+
+        secret_key = os.getenv('OAUTH_SECRET_KEY', 'default-change-in-production')
+        key = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'oauth-credentials'
+        ).derive(secret_key.encode())
+        return AESGCMSIV(key)
 
     def _encrypt_sensitive_data(self, data: str) -> str:
-        """Encrypt sensitive data using simple hash-based encryption"""
+        """Encrypt sensitive data with AES-256-GCM-SIV"""
         if not data:
             return ""
+        if self._aead is None:
+            raise RuntimeError("cryptography is required to encrypt OAuth credentials")
 
-        # Simple encryption using environment-based key
-        secret_key = os.getenv('OAUTH_SECRET_KEY', 'default-change-in-production')
-        combined = f"{secret_key}:{data}"
-        encrypted = hashlib.sha256(combined.encode()).hexdigest()
-        return encrypted
+        nonce = os.urandom(NONCE_SIZE)
+        ciphertext = self._aead.encrypt(nonce, data.encode(), None)
+        return base64.b64encode(ENCRYPTION_VERSION + nonce + ciphertext).decode()
 
-    def _decrypt_sensitive_data(self, encrypted_data: str, reference: str = None) -> str:
-        """For this MVP, we'll store encrypted but work with reference values"""
-        # In production, use proper encryption like AES
-        return reference or ""
+    def _decrypt_sensitive_data(self, encrypted_data: str) -> str:
+        """Decrypt a value produced by _encrypt_sensitive_data"""
+        if not encrypted_data:
+            return ""
+        if self._aead is None:
+            raise RuntimeError("cryptography is required to decrypt OAuth credentials")
+
+        try:
+            blob = base64.b64decode(encrypted_data)
+            if blob[:1] != ENCRYPTION_VERSION:
+                raise ValueError("unknown encryption version")
+            nonce, ciphertext = blob[1:1 + NONCE_SIZE], blob[1 + NONCE_SIZE:]
+            return self._aead.decrypt(nonce, ciphertext, None).decode()
+        except (ValueError, InvalidTag) as e:
+            # Values stored by the old hash-based scheme cannot be recovered
+            logger.error(f"Failed to decrypt stored credential: {e}")
+            return ""
 
     def generate_state_token(self, platform: str) -> str:
         """Generate secure state token for OAuth flow"""
         state = secrets.token_urlsafe(32)
-        expires_at = datetime.now() + timedelta(minutes=10)
+        expires_at = int(time.time()) + STATE_TOKEN_TTL
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
+            # Abandoned flows never reach validate_state_token, so expire them here
+            self._sweep_states(conn)
             conn.execute('''
                 INSERT INTO oauth_states (state_token, platform, expires_at)
                 VALUES (?, ?, ?)
@@ -112,13 +238,20 @@ class OAuthManager:
 
         return state
 
+    def _sweep_states(self, conn: sqlite3.Connection) -> int:
+        """Delete expired state tokens, returning how many were removed"""
+        cursor = conn.execute('DELETE FROM oauth_states WHERE expires_at <= ?', (int(time.time()),))
+        return cursor.rowcount
+
     def validate_state_token(self, state: str) -> Optional[str]:
         """Validate and return platform for state token"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
+            # Lookup and delete in one transaction so a state token is single-use
+            conn.execute('BEGIN IMMEDIATE')
             cursor = conn.execute('''
-                SELECT platform FROM oauth_states
+                SELECT platform FROM oauth_states INDEXED BY idx_state_cov
                 WHERE state_token = ? AND expires_at > ?
-            ''', (state, datetime.now()))
+            ''', (state, int(time.time())))
 
             result = cursor.fetchone()
             if result:
@@ -131,20 +264,51 @@ class OAuthManager:
     def setup_platform_credentials(self, platform: str, client_id: str,
                                   client_secret: str, redirect_uri: str):
         """Setup OAuth credentials for a platform"""
-        encrypted_secret = self._encrypt_sensitive_data(client_secret)
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
+        self.setup_platform_credentials_batch([(platform, client_id, client_secret, redirect_uri)])
+
+    def setup_platform_credentials_batch(self, credentials):
+        """Setup OAuth credentials for several platforms in one transaction.
+
+        credentials is an iterable of (platform, client_id, client_secret, redirect_uri).
+        """
+        now = _now_iso()
+        credentials = list(credentials)
+
+        # Token exchanges reuse these headers instead of re-encoding the secret per request
+        for platform, client_id, client_secret, _ in credentials:
+            self._basic_auth_headers[platform] = self._build_basic_auth_header(client_id, client_secret)
+
+        with self._conn() as conn:
+            # Skip platforms whose stored credentials already match; the secret is
+            # compared decrypted because every encryption uses a fresh nonce
+            existing = {
+                platform: (client_id, self._decrypt_sensitive_data(secret_encrypted), redirect_uri)
+                for platform, client_id, secret_encrypted, redirect_uri in conn.execute('''
+                    SELECT platform, client_id, client_secret_encrypted, redirect_uri
+                    FROM oauth_credentials
+                ''')
+            }
+            rows = [
+                (platform, client_id, self._encrypt_sensitive_data(client_secret), redirect_uri, now)
+                for platform, client_id, client_secret, redirect_uri in credentials
+                if existing.get(platform) != (client_id, client_secret, redirect_uri)
+            ]
+            if not rows:
+                return
+
+            conn.execute('BEGIN')
+            conn.executemany('''
                 INSERT OR REPLACE INTO oauth_credentials
                 (platform, client_id, client_secret_encrypted, redirect_uri, updated_at)
                 VALUES (?, ?, ?, ?, ?)
-            ''', (platform, client_id, encrypted_secret, redirect_uri, datetime.now()))
+            ''', rows)
 
-        logger.info(f"OAuth credentials configured for {platform}")
+        for row in rows:
+            logger.info(f"OAuth credentials configured for {row[0]}")
 
     def get_authorization_url(self, platform: str) -> Optional[str]:
         """Get OAuth authorization URL for platform"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.execute('''
                 SELECT client_id, redirect_uri FROM oauth_credentials
                 WHERE platform = ?
@@ -160,35 +324,32 @@ class OAuthManager:
 
             if platform == 'linkedin':
                 params = {
-                    'response_type': 'code',
                     'client_id': client_id,
                     'redirect_uri': redirect_uri,
-                    'state': state,
-                    'scope': 'r_liteprofile r_emailaddress w_member_social'
+                    'state': state
                 }
 
-                auth_url = f"{self.linkedin_auth_url}?{urllib.parse.urlencode(params)}"
+                auth_url = f"{self.linkedin_auth_url}?{self._LINKEDIN_AUTH_STATIC}&{urllib.parse.urlencode(params)}"
                 return auth_url
 
             elif platform == 'twitter':
                 # Twitter OAuth 2.0 with PKCE
                 code_verifier = secrets.token_urlsafe(32)
-                code_challenge = hashlib.sha256(code_verifier.encode()).hexdigest()
+                # RFC 7636 S256: base64url of the raw SHA-256 digest, without padding
+                digest = hashlib.sha256(code_verifier.encode('ascii')).digest()
+                code_challenge = base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
 
                 params = {
-                    'response_type': 'code',
                     'client_id': client_id,
                     'redirect_uri': redirect_uri,
                     'state': state,
-                    'code_challenge': code_challenge,
-                    'code_challenge_method': 'S256',
-                    'scope': 'tweet.read users.read offline.access'
+                    'code_challenge': code_challenge
                 }
 
                 # Store code verifier for later (in production, use secure session)
                 session[f'{platform}_code_verifier'] = code_verifier
 
-                auth_url = f"{self.twitter_auth_url}?{urllib.parse.urlencode(params)}"
+                auth_url = f"{self.twitter_auth_url}?{self._TWITTER_AUTH_STATIC}&{urllib.parse.urlencode(params)}"
                 return auth_url
 
         return None
@@ -201,7 +362,7 @@ class OAuthManager:
             logger.error("Invalid state token")
             return False
 
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.execute('''
                 SELECT client_id, client_secret_encrypted, redirect_uri
                 FROM oauth_credentials WHERE platform = ?
@@ -212,8 +373,8 @@ class OAuthManager:
                 logger.error(f"No credentials found for {platform}")
                 return False
 
-            client_id, _, redirect_uri = result
-            client_secret = self._decrypt_sensitive_data(_, client_secret)
+            client_id, client_secret_encrypted, redirect_uri = result
+            client_secret = self._decrypt_sensitive_data(client_secret_encrypted)
 
             try:
                 if platform == 'linkedin':
@@ -242,21 +403,23 @@ class OAuthManager:
             'client_secret': client_secret
         }
 
-        response = requests.post(self.linkedin_token_url, data=data)
+        response = self.http.post(self.linkedin_token_url, data=data, timeout=HTTP_TIMEOUT)
 
         if response.status_code == 200:
             token_data = response.json()
             access_token = token_data.get('access_token')
             expires_in = token_data.get('expires_in', 3600)
-            expires_at = datetime.now() + timedelta(seconds=expires_in)
+            expires_at = _now_iso(timedelta(seconds=expires_in))
 
-            # Get user profile info
-            account_info = self._get_linkedin_profile(access_token)
+            # Profile comes embedded in the OpenID id_token; only fall back to the API without it
+            account_info = self._profile_from_id_token(token_data.get('id_token'))
+            if not account_info:
+                account_info = self._get_linkedin_profile(access_token)
 
             # Store tokens
             encrypted_token = self._encrypt_sensitive_data(access_token)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn() as conn:
                 conn.execute('''
                     UPDATE oauth_credentials SET
                     access_token_encrypted = ?, expires_at = ?,
@@ -265,7 +428,7 @@ class OAuthManager:
                     WHERE platform = 'linkedin'
                 ''', (encrypted_token, expires_at,
                       account_info.get('name'), account_info.get('id'), 'personal',
-                      datetime.now()))
+                      _now_iso()))
 
             logger.info("LinkedIn authentication successful")
             return True
@@ -273,6 +436,18 @@ class OAuthManager:
         logger.error(f"LinkedIn token exchange failed: {response.text}")
         return False
 
+    @staticmethod
+    def _build_basic_auth_header(client_id: str, client_secret: str) -> str:
+        """HTTP Basic header for a client"""
+        return f"Basic {base64.b64encode(f'{client_id}:{client_secret}'.encode()).decode()}"
+
+    def _basic_auth_header(self, platform: str, client_id: str, client_secret: str) -> str:
+        """Header built at credential setup, or built once from stored credentials set up by an earlier process"""
+        header = self._basic_auth_headers.get(platform)
+        if header is None:
+            header = self._basic_auth_headers[platform] = self._build_basic_auth_header(client_id, client_secret)
+        return header
+
     def _exchange_twitter_code(self, client_id: str, client_secret: str,
                               redirect_uri: str, code: str, code_verifier: str) -> bool:
         """Exchange Twitter authorization code"""
@@ -284,20 +459,19 @@ class OAuthManager:
             'code_verifier': code_verifier
         }
 
-        auth_header = f"Basic {base64.b64encode(f'{client_id}:{client_secret}'.encode()).decode()}"
         headers = {
-            'Authorization': auth_header,
+            'Authorization': self._basic_auth_header('twitter', client_id, client_secret),
             'Content-Type': 'application/x-www-form-urlencoded'
         }
 
-        response = requests.post(self.twitter_token_url, data=data, headers=headers)
+        response = self.http.post(self.twitter_token_url, data=data, headers=headers, timeout=HTTP_TIMEOUT)
 
         if response.status_code == 200:
             token_data = response.json()
             access_token = token_data.get('access_token')
             refresh_token = token_data.get('refresh_token')
             expires_in = token_data.get('expires_in', 7200)
-            expires_at = datetime.now() + timedelta(seconds=expires_in)
+            expires_at = _now_iso(timedelta(seconds=expires_in))
 
             # Get user profile info
             account_info = self._get_twitter_profile(access_token)
@@ -306,7 +480,7 @@ class OAuthManager:
             encrypted_token = self._encrypt_sensitive_data(access_token)
             encrypted_refresh = self._encrypt_sensitive_data(refresh_token) if refresh_token else None
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self._conn() as conn:
                 conn.execute('''
                     UPDATE oauth_credentials SET
                     access_token_encrypted = ?, refresh_token_encrypted = ?,
@@ -315,7 +489,7 @@ class OAuthManager:
                     WHERE platform = 'twitter'
                 ''', (encrypted_token, encrypted_refresh, expires_at,
                       account_info.get('username'), account_info.get('id'),
-                      datetime.now()))
+                      _now_iso()))
 
             logger.info("Twitter authentication successful")
             return True
@@ -323,46 +497,67 @@ class OAuthManager:
         logger.error(f"Twitter token exchange failed: {response.text}")
         return False
 
-    def _get_linkedin_profile(self, access_token: str) -> Dict:
-        """Get LinkedIn profile information"""
+    @staticmethod
+    def _profile_from_id_token(id_token: Optional[str]) -> Optional[Dict]:
+        """Read id/name claims from an OpenID id_token.
+
+        The token was just received from LinkedIn's token endpoint over TLS,
+        so the claims are read without verifying the signature.
+        """
+        if not id_token:
+            return None
+
+        try:
+            payload = id_token.split('.')[1]
+            claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        except (IndexError, ValueError) as e:
+            logger.error(f"Failed to parse LinkedIn id_token: {e}")
+            return None
+
+        name = claims.get('name') or f"{claims.get('given_name', '')} {claims.get('family_name', '')}".strip()
+        return {'id': claims.get('sub'), 'name': name or 'Unknown'}
+
+    def _get_profile(self, url: str, access_token: str, extract, fallback: Dict) -> Dict:
+        """GET a profile endpoint on the shared session and map the JSON with extract"""
         try:
             headers = {'Authorization': f'Bearer {access_token}'}
-            response = requests.get('https://api.linkedin.com/v2/people/~:(id,firstName,lastName)',
-                                 headers=headers)
+            response = self.http.get(url, headers=headers, timeout=HTTP_TIMEOUT)
 
             if response.status_code == 200:
-                data = response.json()
-                return {
-                    'id': data.get('id'),
-                    'name': f"{data.get('firstName', {}).get('localized', {}).get('en_US', '')} "
-                           f"{data.get('lastName', {}).get('localized', {}).get('en_US', '')}"
-                }
+                return extract(response.json())
         except Exception as e:
-            logger.error(f"Failed to get LinkedIn profile: {e}")
+            logger.error(f"Failed to get profile from {url}: {e}")
+
+        return fallback
 
-        return {'id': None, 'name': 'Unknown'}
+    def _get_linkedin_profile(self, access_token: str) -> Dict:
+        """Get LinkedIn profile information"""
+        def extract(data):
+            return {
+                'id': data.get('id'),
+                'name': f"{data.get('firstName', {}).get('localized', {}).get('en_US', '')} "
+                       f"{data.get('lastName', {}).get('localized', {}).get('en_US', '')}"
+            }
+
+        return self._get_profile('https://api.linkedin.com/v2/people/~:(id,firstName,lastName)',
+                                 access_token, extract, {'id': None, 'name': 'Unknown'})
 
     def _get_twitter_profile(self, access_token: str) -> Dict:
         """Get Twitter profile information"""
-        try:
-            headers = {'Authorization': f'Bearer {access_token}'}
-            response = requests.get('https://api.twitter.com/2/users/me', headers=headers)
-
-            if response.status_code == 200:
-                data = response.json().get('data', {})
-                return {
-                    'id': data.get('id'),
-                    'username': data.get('username'),
-                    'name': data.get('name')
-                }
-        except Exception as e:
-            logger.error(f"Failed to get Twitter profile: {e}")
+        def extract(payload):
+            data = payload.get('data', {})
+            return {
+                'id': data.get('id'),
+                'username': data.get('username'),
+                'name': data.get('name')
+            }
 
-        return {'id': None, 'username': 'Unknown', 'name': 'Unknown'}
+        return self._get_profile('https://api.twitter.com/2/users/me', access_token, extract,
+                                 {'id': None, 'username': 'Unknown', 'name': 'Unknown'})
 
     def get_connection_status(self, platform: str) -> Dict:
         """Get connection status for platform"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.execute('''
                 SELECT is_connected, account_name, account_id, account_type, expires_at, updated_at
                 FROM oauth_credentials WHERE platform = ?
@@ -381,68 +576,32 @@ class OAuthManager:
 
             is_connected, account_name, account_id, account_type, expires_at, updated_at = result
 
-            # Handle datetime parsing - database may return strings
-            if expires_at and isinstance(expires_at, str):
-                try:
-                    from datetime import datetime
-                    expires_at = datetime.fromisoformat(expires_at)
-                except:
-                    expires_at = None
-
-            if updated_at and isinstance(updated_at, str):
-                try:
-                    from datetime import datetime
-                    updated_at = datetime.fromisoformat(updated_at)
-                except:
-                    updated_at = None
-
-            # Handle datetime formatting with better error handling
-            expires_at_str = None
-            if expires_at:
-                try:
-                    if hasattr(expires_at, 'isoformat'):
-                        expires_at_str = expires_at.isoformat()
-                    elif isinstance(expires_at, str):
-                        expires_at_str = expires_at
-                except:
-                    expires_at_str = None
-
-            updated_at_str = None
-            if updated_at:
-                try:
-                    if hasattr(updated_at, 'isoformat'):
-                        updated_at_str = updated_at.isoformat()
-                    elif isinstance(updated_at, str):
-                        updated_at_str = updated_at
-                except:
-                    updated_at_str = None
-
             return {
                 'connected': bool(is_connected),
                 'account_name': account_name,
                 'account_id': account_id,
                 'account_type': account_type,
-                'expires_at': expires_at_str,
-                'last_connected': updated_at_str
+                'expires_at': expires_at,
+                'last_connected': updated_at
             }
 
     def disconnect_platform(self, platform: str) -> bool:
         """Disconnect platform and clear credentials"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             conn.execute('''
                 UPDATE oauth_credentials SET
                 access_token_encrypted = NULL, refresh_token_encrypted = NULL,
                 expires_at = NULL, account_name = NULL, account_id = NULL,
                 account_type = NULL, is_connected = 0, updated_at = ?
                 WHERE platform = ?
-            ''', (datetime.now(), platform))
+            ''', (_now_iso(), platform))
 
         logger.info(f"{platform} disconnected")
         return True
 
     def get_access_token(self, platform: str) -> Optional[str]:
         """Get access token for API calls"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.execute('''
                 SELECT access_token_encrypted FROM oauth_credentials
                 WHERE platform = ? AND is_connected = 1
@@ -450,31 +609,40 @@ class OAuthManager:
 
             result = cursor.fetchone()
             if result:
-                encrypted_token = result[0]
-                # In production, decrypt properly
-                return self._decrypt_sensitive_data(encrypted_token)
+                return self._decrypt_sensitive_data(result[0])
 
         return None
 
-# Global OAuth manager instance
-oauth_manager = OAuthManager()
+# Global OAuth manager instance, created on first use so importing this module stays cheap
+_oauth_manager = None
+_oauth_manager_lock = threading.Lock()
+
+def get_oauth_manager() -> OAuthManager:
+    """Return the shared OAuthManager, creating it on first call"""
+    global _oauth_manager
+    if _oauth_manager is None:
+        with _oauth_manager_lock:
+            if _oauth_manager is None:
+                _oauth_manager = OAuthManager()
+    return _oauth_manager
 
 def setup_oauth_credentials():
     """Setup default OAuth credentials"""
     # These should be loaded from environment variables in production
-    oauth_manager.setup_platform_credentials(
-        'linkedin',
-        os.getenv('LINKEDIN_CLIENT_ID', 'your-linkedin-client-id'),
-        os.getenv('LINKEDIN_CLIENT_SECRET', 'your-linkedin-client-secret'),
-        'http://172.29.89.92:5000/oauth/linkedin/callback'
-    )
-
-    oauth_manager.setup_platform_credentials(
-        'twitter',
-        os.getenv('TWITTER_CLIENT_ID', 'your-twitter-client-id'),
-        os.getenv('TWITTER_CLIENT_SECRET', 'your-twitter-client-secret'),
-        'http://172.29.89.92:5000/oauth/twitter/callback'
-    )
+    get_oauth_manager().setup_platform_credentials_batch([
+        (
+            'linkedin',
+            os.getenv('LINKEDIN_CLIENT_ID', 'your-linkedin-client-id'),
+            os.getenv('LINKEDIN_CLIENT_SECRET', 'your-linkedin-client-secret'),
+            'http://172.29.89.92:5000/oauth/linkedin/callback'
+        ),
+        (
+            'twitter',
+            os.getenv('TWITTER_CLIENT_ID', 'your-twitter-client-id'),
+            os.getenv('TWITTER_CLIENT_SECRET', 'your-twitter-client-secret'),
+            'http://172.29.89.92:5000/oauth/twitter/callback'
+        ),
+    ])
 
 if __name__ == "__main__":
     setup_oauth_credentials()
@@ -13,126 +13,30 @@ import time
 import hashlib
 import sqlite3
 import argparse
+from collections import OrderedDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
 import schedule
 import threading
+import weakref
 
-class ProductionContentGenerator:
-    """Enterprise-grade content generation system for lead generation"""
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-    def __init__(self):
-        self.api_key = os.getenv('ZAI_API_KEY')
-        self.base_url = "https://api.z.ai/api/paas/v4/chat/completions"
-        self.max_workers = 5  # Production parallel processing
-        self.timeout = 30
-        self.cache_db_path = "production_cache/content_cache.db"
-        self.content_db_path = "production_database/content.db"
-        self._init_databases()
-
-    def _init_databases(self):
-        """Initialize production databases"""
-        os.makedirs("production_cache", exist_ok=True)
-        os.makedirs("production_database", exist_ok=True)
+try:
+    import readline  # noqa: F401 - imported for its side effect: line editing and history for the menu prompts
+except ImportError:
+    pass  # Menu prompts still work, just without line editing
 
-        # Cache database
-        with sqlite3.connect(self.cache_db_path) as conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS content_cache (
-                    hash_key TEXT PRIMARY KEY,
-                    content TEXT,
-                    topic TEXT,
-                    style TEXT,
-                    platform TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    expires_at TIMESTAMP,
-                    access_count INTEGER DEFAULT 1,
-                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-
-            # Content database for tracking
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS content_library (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    post_number INTEGER,
-                    topic TEXT,
-                    platform TEXT,
-                    style TEXT,
-                    content TEXT,
-                    content_hash TEXT,
-                    publish_date TEXT,
-                    scheduled_date TEXT,
-                    status TEXT DEFAULT 'draft',
-                    views INTEGER DEFAULT 0,
-                    likes INTEGER DEFAULT 0,
-                    comments INTEGER DEFAULT 0,
-                    shares INTEGER DEFAULT 0,
-                    engagement_rate REAL DEFAULT 0.0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    batch_id TEXT,
-                    UNIQUE(content_hash)
-                )
-            ''')
-
-            # Analytics database
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS analytics (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    date TEXT,
-                    platform TEXT,
-                    total_posts INTEGER DEFAULT 0,
-                    total_views INTEGER DEFAULT 0,
-                    total_likes INTEGER DEFAULT 0,
-                    total_comments INTEGER DEFAULT 0,
-                    total_shares INTEGER DEFAULT 0,
-                    avg_engagement_rate REAL DEFAULT 0.0,
-                    top_performing_topic TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            conn.commit()
-
-    def get_cache_key(self, topic: str, style: str, platform: str = "linkedin") -> str:
-        """Generate optimized cache key"""
-        cache_data = f"{topic.lower().strip()}|{style}|{platform}"
-        return hashlib.md5(cache_data.encode()).hexdigest()
-
-    def check_cache(self, cache_key: str) -> str:
-        """Fast cache lookup with TTL"""
-        with sqlite3.connect(self.cache_db_path) as conn:
-            cursor = conn.execute(
-                'SELECT content FROM content_cache WHERE hash_key = ? AND expires_at > datetime("now")',
-                (cache_key,)
-            )
-            result = cursor.fetchone()
-            if result:
-                # Update access tracking
-                conn.execute(
-                    'UPDATE content_cache SET access_count = access_count + 1, last_accessed = datetime("now") WHERE hash_key = ?',
-                    (cache_key,)
-                )
-                conn.commit()
-            return result[0] if result else None
-
-    def cache_content(self, cache_key: str, content: str, topic: str, style: str, platform: str = "linkedin"):
-        """Cache content with production TTL"""
-        expires_at = datetime.now() + timedelta(days=7)  # 7-day cache for production
-        with sqlite3.connect(self.cache_db_path) as conn:
-            conn.execute(
-                'INSERT OR REPLACE INTO content_cache (hash_key, content, topic, style, platform, expires_at) VALUES (?, ?, ?, ?, ?, ?)',
-                (cache_key, content, topic, style, platform, expires_at)
-            )
-            conn.commit()
-
-    def create_production_prompt(self, topic: str, style: str, platform: str = "linkedin") -> str:
-        """Create professional prompts optimized for lead generation"""
-
-        style_prompts = {
-            'educational': {
-                'linkedin': """You are a senior content strategist writing for Merryl D'Mello, founder of Ardelis Technologies, who builds agentic AI systems for European businesses.
+# Prompt templates per style and platform; {topic} is filled in per post
+STYLE_PROMPTS = {
+    'educational': {
+        'linkedin': """You are a senior content strategist writing for Merryl D'Mello, founder of Ardelis Technologies, who builds agentic AI systems for European businesses.
 
 Topic: {topic}
 
@@ -152,7 +56,7 @@ Style guidelines:
 
 Write as if you're a consultant sharing expert insights with C-suite executives.""",
 
-                'twitter': """You are a tech thought leader sharing insights about {topic}.
+        'twitter': """You are a tech thought leader sharing insights about {topic}.
 
 Create a Twitter thread (5-7 tweets total):
 - Tweet 1: Hook that grabs attention
@@ -169,10 +73,10 @@ Style guidelines:
 - End with engagement driver
 
 Create JSON array: ["tweet1", "tweet2", ...]""",
-            },
+    },
 
-            'case_study': {
-                'linkedin': """You are Merryl D'Mello sharing a successful agentic AI implementation.
+    'case_study': {
+        'linkedin': """You are Merryl D'Mello sharing a successful agentic AI implementation.
 
 Write a LinkedIn case study about: {topic}
 
@@ -194,7 +98,7 @@ Style guidelines:
 
 Make it feel like a genuine success story with real impact.""",
 
-                'twitter': """Share a case study about {topic} on Twitter.
+        'twitter': """Share a case study about {topic} on Twitter.
 
 Create a thread (6-8 tweets):
 1. Impressive result hook
@@ -207,10 +111,10 @@ Create a thread (6-8 tweets):
 8. Call to action
 
 Focus on concrete numbers and outcomes. Make it actionable for other businesses.""",
-            },
+    },
 
-            'story': {
-                'linkedin': """You are Merryl D'Mello sharing a personal journey with agentic AI.
+    'story': {
+        'linkedin': """You are Merryl D'Mello sharing a personal journey with agentic AI.
 
 Write a LinkedIn story about: {topic}
 
@@ -232,7 +136,7 @@ Style guidelines:
 
 Make it feel like a genuine journey that others can learn from.""",
 
-                'twitter': """Share a personal story about {topic}.
+        'twitter': """Share a personal story about {topic}.
 
 Create a thread (6-8 tweets) showing your journey:
 1. Where you started
@@ -245,10 +149,10 @@ Create a thread (6-8 tweets) showing your journey:
 8. Inspiring closing
 
 Keep it personal, authentic, and actionable."""
-            },
+    },
 
-            'insight': {
-                'linkedin': """You are a forward-thinking expert sharing contrarian insights about {topic}.
+    'insight': {
+        'linkedin': """You are a forward-thinking expert sharing contrarian insights about {topic}.
 
 Write a LinkedIn insight post that:
 1. Challenges conventional wisdom
@@ -268,7 +172,7 @@ Style guidelines:
 
 Take a strong, defensible position that others may disagree with but can't ignore.""",
 
-                'twitter': """Share a provocative insight about {topic}.
+        'twitter': """Share a provocative insight about {topic}.
 
 Create a thread (5-6 tweets):
 1. Contrarian statement
@@ -279,33 +183,316 @@ Create a thread (5-6 tweets):
 6. Call to question/discussion
 
 Be bold but professional. Back up your claims with logic."""
-            }
+    }
+}
+
+
+def content_digest(content: str) -> str:
+    """Dedup hash stored in content_library.content_hash"""
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class ProductionContentGenerator:
+    """Enterprise-grade content generation system for lead generation"""
+
+    def __init__(self):
+        self.api_key = os.getenv('ZAI_API_KEY')
+        self.base_url = "https://api.z.ai/api/paas/v4/chat/completions"
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
         }
+        self.max_workers = 5  # Production parallel processing
+        self.timeout = 30
+        self.cache_db_path = "production_cache/content_cache.db"
+        self.content_db_path = "production_database/content.db"
+        self._write_queue = None  # Set while generate_batch_async runs its writer task
+        self.mem_cache_size = 512  # In-process LRU in front of the SQLite cache
+        self._mem_cache = OrderedDict()  # cache_key -> (content, expiry timestamp)
+        self._init_databases()
+        # Closes the databases at exit without keeping the generator alive until then
+        self._finalizer = weakref.finalize(
+            self, self._close_connections,
+            ((self._cache_conn, self._cache_lock), (self._content_conn, self._content_lock))
+        )
+
+    @staticmethod
+    def _connect(path: str) -> sqlite3.Connection:
+        """Open a long-lived autocommit connection tuned for this workload"""
+        conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA cache_size=-64000')
+        conn.execute('PRAGMA mmap_size=30000000000')
+        return conn
+
+    def _init_databases(self):
+        """Initialize production databases"""
+        os.makedirs("production_cache", exist_ok=True)
+        os.makedirs("production_database", exist_ok=True)
+
+        # One persistent connection per database, shared across threads behind a lock
+        self._cache_conn = self._connect(self.cache_db_path)
+        self._cache_lock = threading.Lock()
+        self._content_conn = self._connect(self.content_db_path)
+        self._content_conn.row_factory = sqlite3.Row
+        self._content_lock = threading.Lock()
+
+        # Cache database
+        with self._cache_lock:
+            self._cache_conn.execute('''
+                CREATE TABLE IF NOT EXISTS content_cache (
+                    hash_key TEXT PRIMARY KEY,
+                    content TEXT,
+                    topic TEXT,
+                    style TEXT,
+                    platform TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    expires_at INTEGER,
+                    access_count INTEGER DEFAULT 1,
+                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            self._cache_conn.execute('CREATE INDEX IF NOT EXISTS idx_cache_expiry ON content_cache(expires_at)')
+
+            # expires_at is unix epoch seconds; convert rows written as local timestamp text
+            self._cache_conn.execute(
+                "UPDATE content_cache SET expires_at = CAST(strftime('%s', expires_at, 'utc') AS INTEGER) "
+                "WHERE typeof(expires_at) = 'text'"
+            )
+
+        with self._content_lock:
+            conn = self._content_conn
 
-        templates = style_prompts.get(style, style_prompts['educational'])
+            # Content database for tracking
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS content_library (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    post_number INTEGER,
+                    topic TEXT,
+                    platform TEXT,
+                    style TEXT,
+                    content TEXT,
+                    content_hash TEXT,
+                    publish_date TEXT,
+                    scheduled_date TEXT,
+                    status TEXT DEFAULT 'draft',
+                    views INTEGER DEFAULT 0,
+                    likes INTEGER DEFAULT 0,
+                    comments INTEGER DEFAULT 0,
+                    shares INTEGER DEFAULT 0,
+                    engagement_rate REAL DEFAULT 0.0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    batch_id TEXT,
+                    UNIQUE(content_hash)
+                )
+            ''')
+
+            # Analytics database
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS analytics (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    date TEXT,
+                    platform TEXT,
+                    total_posts INTEGER DEFAULT 0,
+                    total_views INTEGER DEFAULT 0,
+                    total_likes INTEGER DEFAULT 0,
+                    total_comments INTEGER DEFAULT 0,
+                    total_shares INTEGER DEFAULT 0,
+                    avg_engagement_rate REAL DEFAULT 0.0,
+                    top_performing_topic TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Analytics filters on published posts with views, grouped by platform or topic
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_library_status_views ON content_library(status, views, platform)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_library_topic_eng ON content_library(status, topic, engagement_rate)')
+
+            # content_hash switched from MD5 to blake2b; rehash rows stored before the change
+            if conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+                conn.create_function('content_digest', 1, content_digest, deterministic=True)
+                with conn:
+                    conn.execute('BEGIN')
+                    conn.execute('UPDATE content_library SET content_hash = content_digest(content)')
+                    conn.execute('PRAGMA user_version = 1')
+
+    def close(self):
+        """Let SQLite refresh stale statistics, then close both database connections"""
+        self._finalizer()
+
+    @staticmethod
+    def _close_connections(connections):
+        """Optimize and close each (connection, lock) pair; runs once, from close() or the finalizer"""
+        for conn, lock in connections:
+            with lock:
+                try:
+                    conn.execute('PRAGMA optimize')
+                    conn.close()
+                except sqlite3.ProgrammingError:
+                    pass  # Already closed
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def get_cache_key(topic: str, style: str, platform: str = "linkedin") -> str:
+        """Generate optimized cache key, memoized since topics repeat across batches"""
+        cache_data = f"{topic.lower().strip()}|{style}|{platform}"
+        return hashlib.blake2b(cache_data.encode(), digest_size=16).hexdigest()
+
+    def _mem_get(self, cache_key: str) -> str:
+        """In-process LRU lookup; caller must hold _cache_lock"""
+        entry = self._mem_cache.get(cache_key)
+        if entry is None:
+            return None
+        content, expires = entry
+        if expires <= time.time():
+            del self._mem_cache[cache_key]
+            return None
+        self._mem_cache.move_to_end(cache_key)
+        return content
+
+    def _mem_put(self, cache_key: str, content: str, expires_at: int):
+        """Store content in the in-process LRU; caller must hold _cache_lock"""
+        self._mem_cache[cache_key] = (content, expires_at)
+        self._mem_cache.move_to_end(cache_key)
+        if len(self._mem_cache) > self.mem_cache_size:
+            self._mem_cache.popitem(last=False)
+
+    def check_cache(self, cache_key: str) -> str:
+        """Fast cache lookup with TTL"""
+        with self._cache_lock:
+            content = self._mem_get(cache_key)
+            if content is not None:
+                return content
+
+            conn = self._cache_conn
+            cursor = conn.execute(
+                'SELECT content, expires_at FROM content_cache WHERE hash_key = ? AND expires_at > ?',
+                (cache_key, int(time.time()))
+            )
+            result = cursor.fetchone()
+            if result:
+                # Update access tracking
+                conn.execute(
+                    'UPDATE content_cache SET access_count = access_count + 1, last_accessed = datetime("now") WHERE hash_key = ?',
+                    (cache_key,)
+                )
+                self._mem_put(cache_key, result[0], result[1])
+            return result[0] if result else None
+
+    def check_cache_bulk(self, cache_keys: List[str]) -> Dict[str, str]:
+        """Look up many cache keys in one query, returning {hash_key: content} for hits"""
+        if not cache_keys:
+            return {}
+
+        with self._cache_lock:
+            hits = {}
+            for cache_key in cache_keys:
+                content = self._mem_get(cache_key)
+                if content is not None:
+                    hits[cache_key] = content
+
+            missing = [cache_key for cache_key in cache_keys if cache_key not in hits]
+            if not missing:
+                return hits
+
+            conn = self._cache_conn
+            placeholders = ",".join("?" * len(missing))
+            cursor = conn.execute(
+                f"SELECT hash_key, content, expires_at FROM content_cache WHERE hash_key IN ({placeholders}) AND expires_at > ?",
+                missing + [int(time.time())]
+            )
+            db_hits = []
+            for cache_key, content, expires_at in cursor.fetchall():
+                hits[cache_key] = content
+                db_hits.append(cache_key)
+                self._mem_put(cache_key, content, expires_at)
+
+            if db_hits:
+                # Update access tracking for every hit in a single statement
+                hit_placeholders = ",".join("?" * len(db_hits))
+                conn.execute(
+                    f"UPDATE content_cache SET access_count = access_count + 1, last_accessed = datetime('now') WHERE hash_key IN ({hit_placeholders})",
+                    db_hits
+                )
+            return hits
+
+    def cache_content(self, cache_key: str, content: str, topic: str, style: str, platform: str = "linkedin"):
+        """Cache content with production TTL"""
+        self.cache_content_many([(cache_key, content, topic, style, platform)])
+
+    def cache_content_many(self, entries: List[tuple]):
+        """Cache (cache_key, content, topic, style, platform) entries in one transaction"""
+        expires_at = int((datetime.now() + timedelta(days=7)).timestamp())  # 7-day cache for production
+        with self._cache_lock, self._cache_conn as conn:
+            conn.execute('BEGIN')
+            conn.executemany(
+                'INSERT OR REPLACE INTO content_cache (hash_key, content, topic, style, platform, expires_at) VALUES (?, ?, ?, ?, ?, ?)',
+                [entry + (expires_at,) for entry in entries]
+            )
+            for cache_key, content, *_ in entries:
+                self._mem_put(cache_key, content, expires_at)
+
+    async def _writer_loop(self):
+        """Drain queued cache writes, committing each burst in a single transaction"""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            entries = [entry for entry in batch if entry is not None]
+            if entries:
+                try:
+                    await asyncio.to_thread(self.cache_content_many, entries)
+                except Exception:
+                    # Retry one by one so a single bad entry only loses its own cache write
+                    for entry in entries:
+                        try:
+                            await asyncio.to_thread(self.cache_content_many, [entry])
+                        except Exception as e:
+                            print(f"⚠️ Cache write failed for {entry[2]}: {e}")
+            if None in batch:  # Shutdown sentinel from generate_batch_async
+                return
+
+    def create_production_prompt(self, topic: str, style: str, platform: str = "linkedin") -> str:
+        """Create professional prompts optimized for lead generation"""
+        templates = STYLE_PROMPTS.get(style, STYLE_PROMPTS['educational'])
         prompt = templates.get(platform, templates['linkedin'])
 
-        return prompt.format(topic=topic)
+        return prompt.replace('{topic}', topic)
+
+    @staticmethod
+    def _cached_result(topic_data: Dict[str, Any], content: str, platform: str) -> Dict[str, Any]:
+        """Result dict for a post served from the cache"""
+        return {
+            'success': True,
+            'topic': topic_data['topic'],
+            'content': content,
+            'style': topic_data['style'],
+            'platform': platform,
+            'cached': True,
+            'generation_time': 0.1
+        }
+
+    async def generate_content_async(self, topic_data: Dict[str, Any], session: aiohttp.ClientSession, platform: str = "linkedin",
+                                     cached_content: str = None, prefetched: bool = False) -> Dict[str, Any]:
+        """Generate content with production-grade quality and caching
 
-    async def generate_content_async(self, topic_data: Dict[str, Any], session: aiohttp.ClientSession, platform: str = "linkedin") -> Dict[str, Any]:
-        """Generate content with production-grade quality and caching"""
+        When prefetched is set the caller has already probed the cache (see
+        check_cache_bulk) and cached_content holds the hit, if any.
+        """
         topic = topic_data['topic']
         style = topic_data['style']
 
         # Check cache first
         cache_key = self.get_cache_key(topic, style, platform)
-        cached_content = self.check_cache(cache_key)
+        if not prefetched:
+            cached_content = await asyncio.to_thread(self.check_cache, cache_key)
 
         if cached_content:
-            return {
-                'success': True,
-                'topic': topic,
-                'content': cached_content,
-                'style': style,
-                'platform': platform,
-                'cached': True,
-                'generation_time': 0.1
-            }
+            return self._cached_result(topic_data, cached_content, platform)
 
         # Generate new content
         prompt = self.create_production_prompt(topic, style, platform)
@@ -323,27 +510,28 @@ Be bold but professional. Back up your claims with logic."""
             async with session.post(
                 self.base_url,
                 json=payload,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                },
+                headers=self._headers,
                 timeout=self.timeout
             ) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    raw = await response.read()
+                    result = orjson.loads(raw) if orjson else json.loads(raw)
                     content = result["choices"][0]["message"]["content"]
 
                     # Process Twitter JSON if needed
                     if platform == 'twitter' and style in ['educational', 'case_study', 'story', 'insight']:
                         try:
-                            content = json.loads(content)
+                            content = orjson.loads(content) if orjson else json.loads(content)
                             if isinstance(content, list):
                                 content = '\n\n'.join(content)
                         except:
                             pass  # Keep as regular text if JSON parsing fails
 
-                    # Cache the result
-                    self.cache_content(cache_key, content, topic, style, platform)
+                    # Cache the result, through the batch writer task when one is running
+                    if self._write_queue is not None:
+                        await self._write_queue.put((cache_key, content, topic, style, platform))
+                    else:
+                        await asyncio.to_thread(self.cache_content, cache_key, content, topic, style, platform)
 
                     generation_time = time.time() - start_time
 
@@ -371,6 +559,48 @@ Be bold but professional. Back up your claims with logic."""
                 'generation_time': time.time() - start_time
             }
 
+    async def _generate_misses(self, misses: List[tuple], platform: str, results: List[Any]):
+        """Generate uncached (index, topic) posts concurrently, storing each result at its batch index"""
+        # Cache writes from all tasks go through one writer that batches commits
+        self._write_queue = asyncio.Queue()
+        writer = asyncio.create_task(self._writer_loop())
+
+        # At most max_workers requests in flight, over pooled keep-alive connections
+        semaphore = asyncio.Semaphore(self.max_workers)
+        connector = aiohttp.TCPConnector(
+            limit=self.max_workers,
+            limit_per_host=self.max_workers,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+
+        async def generate_bounded(index, topic):
+            try:
+                async with semaphore:
+                    return index, await self.generate_content_async(topic, session, platform, prefetched=True)
+            except Exception as e:
+                return index, e
+
+        try:
+            async with aiohttp.ClientSession(connector=connector) as session:
+                tasks = [generate_bounded(i, topic) for i, topic in misses]
+
+                # Report each post as it finishes; results keep the batch order
+                for next_done in asyncio.as_completed(tasks):
+                    i, result = await next_done
+                    results[i] = result
+                    if isinstance(result, Exception):
+                        continue
+                    if result['success']:
+                        print(f"✅ Generated: {result['topic']}")
+                    else:
+                        print(f"❌ Failed: {result.get('topic', 'Unknown')} - {result.get('error', 'Unknown error')}")
+        finally:
+            await self._write_queue.put(None)
+            await writer
+            self._write_queue = None
+
     async def generate_batch_async(self, topics_data: List[Dict[str, Any]], num_posts: int = 5, platform: str = "linkedin") -> tuple:
         """Generate content batch with production parallel processing"""
         if not topics_data:
@@ -384,14 +614,22 @@ Be bold but professional. Back up your claims with logic."""
 
         start_time = time.time()
 
-        async with aiohttp.ClientSession() as session:
-            tasks = [
-                self.generate_content_async(topic, session, platform)
-                for topic in selected_topics
-            ]
+        # Probe the cache for the whole batch in one round trip
+        keys = [self.get_cache_key(t['topic'], t['style'], platform) for t in selected_topics]
+        cached = await asyncio.to_thread(self.check_cache_bulk, keys)
+
+        # Cache hits are answered immediately; only misses are scheduled as requests
+        results = [None] * len(selected_topics)
+        misses = []
+        for i, (topic, key) in enumerate(zip(selected_topics, keys)):
+            if key in cached:
+                results[i] = self._cached_result(topic, cached[key], platform)
+                print(f"✅ [CACHED] Generated: {topic['topic']}")
+            else:
+                misses.append((i, topic))
 
-            # Execute with concurrency control
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        if misses:
+            await self._generate_misses(misses, platform, results)
 
         end_time = time.time()
         total_time = end_time - start_time
@@ -413,10 +651,8 @@ Be bold but professional. Back up your claims with logic."""
                 total_generation_time += result.get('generation_time', 0)
                 if result['cached']:
                     cache_hits += 1
-                print(f"✅ {'[CACHED] ' if result['cached'] else ''}Generated: {result['topic']}")
             else:
                 failed_posts.append(result)
-                print(f"❌ Failed: {result.get('topic', 'Unknown')} - {result.get('error', 'Unknown error')}")
 
         # Production metrics
         avg_time_per_post = total_time / len(selected_topics) if selected_topics else 0
@@ -448,61 +684,37 @@ Be bold but professional. Back up your claims with logic."""
             return None
 
         batch_id = batch_id or f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        timestamp = datetime.now().isoformat()
-
-        enhanced_posts = []
-        with sqlite3.connect(self.content_db_path) as conn:
-            for i, post in enumerate(posts):
-                content_hash = hashlib.md5(post['content'].encode()).hexdigest()
-
-                # Check if already exists
-                existing = conn.execute(
-                    'SELECT id FROM content_library WHERE content_hash = ?',
-                    (content_hash,)
-                ).fetchone()
-
-                if not existing:
-                    conn.execute('''
-                        INSERT INTO content_library (
-                            post_number, topic, platform, style, content, content_hash,
-                            publish_date, scheduled_date, status, batch_id
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        i + 1,
-                        post['topic'],
-                        platform,
-                        post['style'],
-                        post['content'],
-                        content_hash,
-                        datetime.now().strftime('%Y-%m-%d'),
-                        None,  # Scheduled date
-                        'draft',
-                        batch_id
-                    ))
-
-                    enhanced_posts.append({
-                        'post_number': i + 1,
-                        'topic': post['topic'],
-                        'platform': platform,
-                        'style': post['style'],
-                        'content': post['content'],
-                        'content_hash': content_hash,
-                        'publish_date': datetime.now().strftime('%Y-%m-%d'),
-                        'scheduled_date': None,
-                        'status': 'draft',
-                        'created_at': timestamp,
-                        'batch_id': batch_id,
-                        'cached': post.get('cached', False),
-                        'views': 0,
-                        'likes': 0,
-                        'comments': 0,
-                        'shares': 0,
-                        'engagement_rate': 0.0
-                    })
-
-            conn.commit()
-
-        print(f"💾 Saved {len(enhanced_posts)} posts to production database")
+        publish_date = datetime.now().strftime('%Y-%m-%d')
+
+        rows = [
+            (
+                i + 1,
+                post['topic'],
+                platform,
+                post['style'],
+                post['content'],
+                content_digest(post['content']),
+                publish_date,
+                None,  # Scheduled date
+                'draft',
+                batch_id
+            )
+            for i, post in enumerate(posts)
+        ]
+
+        # UNIQUE(content_hash) skips content that is already in the library
+        with self._content_lock, self._content_conn as conn:
+            changes_before = conn.total_changes
+            conn.execute('BEGIN')
+            conn.executemany('''
+                INSERT OR IGNORE INTO content_library (
+                    post_number, topic, platform, style, content, content_hash,
+                    publish_date, scheduled_date, status, batch_id
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            saved = conn.total_changes - changes_before
+
+        print(f"💾 Saved {saved} posts to production database")
         return batch_id
 
     def generate_content_calendar(self, topics_file: str = 'topics.json', num_days: int = 30) -> List[Dict[str, Any]]:
@@ -515,17 +727,19 @@ Be bold but professional. Back up your claims with logic."""
 
         content_calendar = []
 
-        for day in range(num_days):
-            # Cycle through topics
-            topic_index = day % len(topics)
-            topic = topics[topic_index]
+        # Cycle through topics
+        day_topics = [topics[day % len(topics)] for day in range(num_days)]
 
-            # Generate content for the day
-            successful_posts, _ = self.generate_batch_sync([topic], 1, 'linkedin')
+        # Generate each distinct topic once, in a single parallel batch; days that
+        # cycle back to a topic reuse its post, as the cache did for serial runs
+        unique_topics = day_topics[:len(topics)]
+        successful_posts, _ = self.generate_batch_sync(unique_topics, len(unique_topics), 'linkedin')
+        generated = {(post['topic'], post['style']): post for post in successful_posts}
 
-            if successful_posts:
-                post = successful_posts[0]
+        for day, topic in enumerate(day_topics):
+            post = generated.get((topic['topic'], topic['style']))
 
+            if post:
                 content_calendar.append({
                     'day': day + 1,
                     'date': (datetime.now() + timedelta(days=day)).strftime('%Y-%m-%d'),
@@ -544,45 +758,70 @@ Be bold but professional. Back up your claims with logic."""
             print(f"✅ Day {day + 1}: {topic['topic']}")
 
         # Save calendar
-        with open('production_content_calendar.json', 'w') as f:
-            json.dump(content_calendar, f, indent=2)
+        if orjson:
+            with open('production_content_calendar.json', 'wb') as f:
+                f.write(orjson.dumps(content_calendar, option=orjson.OPT_INDENT_2))
+        else:
+            with open('production_content_calendar.json', 'w') as f:
+                json.dump(content_calendar, f, indent=2)
 
         print(f"📅 Saved {len(content_calendar)}-day content calendar")
         return content_calendar
 
     def get_analytics_summary(self) -> Dict[str, Any]:
         """Get production analytics summary"""
-        with sqlite3.connect(self.content_db_path) as conn:
-            conn.row_factory = sqlite3.Row
-
-            # Content library stats
-            total_posts = conn.execute('SELECT COUNT(*) FROM content_library').fetchone()[0]
-            published_posts = conn.execute('SELECT COUNT(*) FROM content_library WHERE status = "published"').fetchone()[0]
-
-            # Performance stats
-            cursor = conn.execute('''
-                SELECT platform, AVG(engagement_rate) as avg_engagement,
-                       SUM(views) as total_views, SUM(likes) as total_likes,
-                       SUM(comments) as total_comments, SUM(shares) as total_shares,
-                       COUNT(*) as post_count
-                FROM content_library
-                WHERE status = "published" AND views > 0
-                GROUP BY platform
-            ''')
-
-            performance = [dict(row) for row in cursor.fetchall()]
-
-            # Top performing content
-            cursor = conn.execute('''
-                SELECT topic, AVG(engagement_rate) as avg_engagement, COUNT(*) as post_count
-                FROM content_library
-                WHERE status = "published" AND views > 0
-                GROUP BY topic
-                ORDER BY avg_engagement DESC
-                LIMIT 10
-            ''')
-
-            top_content = [dict(row) for row in cursor.fetchall()]
+        with self._content_lock:
+            conn = self._content_conn
+
+            # Both statements read from one snapshot
+            conn.execute('BEGIN')
+            try:
+                # Content library stats
+                total_posts, published_posts = conn.execute('''
+                    SELECT COUNT(*), COUNT(*) FILTER (WHERE status = 'published')
+                    FROM content_library
+                ''').fetchone()
+
+                # Performance by platform and top performing topics in one pass over published posts
+                cursor = conn.execute('''
+                    WITH published AS (
+                        SELECT platform, topic, engagement_rate, views, likes, comments, shares
+                        FROM content_library
+                        WHERE status = 'published' AND views > 0
+                    ),
+                    top_topics AS (
+                        SELECT 'topic' as kind, topic as name, AVG(engagement_rate) as avg_engagement,
+                               NULL, NULL, NULL, NULL, COUNT(*) as post_count
+                        FROM published
+                        GROUP BY topic
+                        ORDER BY avg_engagement DESC
+                        LIMIT 10
+                    )
+                    SELECT 'platform' as kind, platform as name, AVG(engagement_rate) as avg_engagement,
+                           SUM(views) as total_views, SUM(likes) as total_likes,
+                           SUM(comments) as total_comments, SUM(shares) as total_shares,
+                           COUNT(*) as post_count
+                    FROM published
+                    GROUP BY platform
+                    UNION ALL
+                    SELECT * FROM top_topics
+                ''')
+                rows = cursor.fetchall()
+            finally:
+                conn.execute('COMMIT')
+
+            performance = [
+                {'platform': row['name'], **{key: row[key] for key in row.keys()[2:]}}
+                for row in rows if row['kind'] == 'platform'
+            ]
+            top_content = sorted(
+                (
+                    {'topic': row['name'], 'avg_engagement': row['avg_engagement'], 'post_count': row['post_count']}
+                    for row in rows if row['kind'] == 'topic'
+                ),
+                key=lambda topic: topic['avg_engagement'] or 0.0,  # AVG is NULL when no rate was recorded
+                reverse=True
+            )
 
             return {
                 'total_content_generated': total_posts,
@@ -604,13 +843,105 @@ def load_topics():
         return []
 
 
+def run_single_batch(generator, topics):
+    """Menu 1: generate a single batch of 5 LinkedIn posts"""
+    print(f"\n⚡ Generating 5 LinkedIn posts...")
+    posts, _ = generator.generate_batch_sync(topics, 5, 'linkedin')
+    if posts:
+        batch_id = generator.save_to_production_db(posts, 'linkedin')
+        print(f"✅ Batch {batch_id} saved to production database")
+
+
+def run_large_batch(generator, topics):
+    """Menu 2: generate a large batch of 20 LinkedIn posts"""
+    print(f"\n⚡ Generating 20 LinkedIn posts...")
+    posts, _ = generator.generate_batch_sync(topics, 20, 'linkedin')
+    if posts:
+        batch_id = generator.save_to_production_db(posts, 'linkedin')
+        print(f"✅ Large batch {batch_id} saved to production database")
+
+
+def run_content_calendar(generator, topics):
+    """Menu 3: generate the 30-day content calendar"""
+    print(f"\n📅 Generating 30-day content calendar...")
+    calendar = generator.generate_content_calendar(num_days=30)
+    print(f"✅ Content calendar generated and saved")
+
+
+def run_custom_batch(generator, topics):
+    """Menu 4: generate a custom-sized batch for a chosen platform"""
+    try:
+        num_posts = int(input("Number of posts (1-50): "))
+        platform = input("Platform (linkedin/twitter) [linkedin]: ").strip() or "linkedin"
+        num_posts = max(1, min(50, num_posts))
+
+        print(f"\n⚡ Generating {num_posts} {platform} posts...")
+        posts, _ = generator.generate_batch_sync(topics, num_posts, platform)
+        if posts:
+            batch_id = generator.save_to_production_db(posts, platform)
+            print(f"✅ Custom batch {batch_id} saved to production database")
+
+    except ValueError:
+        print("❌ Invalid number")
+
+
+def show_analytics(generator, topics):
+    """Menu 5: print the production analytics report"""
+    # Build the report first, then print it in one write
+    analytics = generator.get_analytics_summary()
+
+    lines = [
+        "\n📊 Production Analytics:",
+        f"📝 Total Content Generated: {analytics['total_content_generated']}",
+        f"📤 Content Published: {analytics['content_published']}",
+        f"📋 Content Draft: {analytics['content_draft']}"
+    ]
+
+    if analytics['platform_performance']:
+        lines.append("\n📈 Platform Performance:")
+        for perf in analytics['platform_performance']:
+            lines.append(f"  {perf['platform']}: {perf['avg_engagement']:.1f}% engagement")
+
+    if analytics['top_performing_topics']:
+        lines.append("\n🏆 Top Performing Topics:")
+        for i, topic in enumerate(analytics['top_performing_topics'][:5], 1):
+            lines.append(f"  {i}. {topic['topic']}: {topic['avg_engagement']:.1f}% engagement")
+
+    print("\n".join(lines))
+
+
+def run_emergency_batch(generator, topics):
+    """Menu 6: generate 100 LinkedIn posts after confirmation"""
+    print(f"\n🚨 EMERGENCY MODE: 100 posts")
+    print("This will take approximately 3-5 minutes...")
+
+    if input("Continue? (y/N): ").lower().startswith('y'):
+        posts, _ = generator.generate_batch_sync(topics, 100, 'linkedin')
+        if posts:
+            batch_id = generator.save_to_production_db(posts, 'linkedin')
+            print(f"✅ Emergency batch {batch_id} saved to production database")
+
+
+# Production menu choice -> handler(generator, topics)
+MENU_ACTIONS = {
+    '1': run_single_batch,
+    '2': run_large_batch,
+    '3': run_content_calendar,
+    '4': run_custom_batch,
+    '5': show_analytics,
+    '6': run_emergency_batch
+}
+
+
 def main():
     """Production content generator main function"""
-    print("🚀 PRODUCTION CONTENT AUTOMATION MACHINE")
-    print("=" * 60)
-    print("Enterprise-grade content generation for lead generation")
-    print("Goal: Generate €100,000+ in revenue")
-    print("=" * 60)
+    print("\n".join([
+        "🚀 PRODUCTION CONTENT AUTOMATION MACHINE",
+        "=" * 60,
+        "Enterprise-grade content generation for lead generation",
+        "Goal: Generate €100,000+ in revenue",
+        "=" * 60
+    ]))
 
     # Load configuration
     topics = load_topics()
@@ -620,89 +951,26 @@ def main():
 
     generator = ProductionContentGenerator()
 
-    print(f"\n📊 Available Topics: {len(topics)}")
-    print(f"🎯 Styles: {len(set(t['style'] for t in topics))}")
-    print(f"🚀 Production Cache: 7-day TTL")
-    print(f"⚡ Parallel Processing: {generator.max_workers} workers")
-
-    # Interactive production menu
-    print(f"\n📋 Production Menu:")
-    print("1. Generate single batch (5 posts)")
-    print("2. Generate large batch (20 posts)")
-    print("3. Generate 30-day content calendar")
-    print("4. Custom batch generation")
-    print("5. View analytics")
-    print("6. Emergency batch (100 posts)")
+    # Stats and interactive production menu, emitted in a single write
+    print("\n".join([
+        f"\n📊 Available Topics: {len(topics)}",
+        f"🎯 Styles: {len(set(t['style'] for t in topics))}",
+        "🚀 Production Cache: 7-day TTL",
+        f"⚡ Parallel Processing: {generator.max_workers} workers",
+        "\n📋 Production Menu:",
+        "1. Generate single batch (5 posts)",
+        "2. Generate large batch (20 posts)",
+        "3. Generate 30-day content calendar",
+        "4. Custom batch generation",
+        "5. View analytics",
+        "6. Emergency batch (100 posts)"
+    ]))
 
     choice = input("\nSelect option (1-6): ").strip()
 
-    if choice == '1':
-        # Single batch
-        print(f"\n⚡ Generating 5 LinkedIn posts...")
-        posts, _ = generator.generate_batch_sync(topics, 5, 'linkedin')
-        if posts:
-            batch_id = generator.save_to_production_db(posts, 'linkedin')
-            print(f"✅ Batch {batch_id} saved to production database")
-
-    elif choice == '2':
-        # Large batch
-        print(f"\n⚡ Generating 20 LinkedIn posts...")
-        posts, _ = generator.generate_batch_sync(topics, 20, 'linkedin')
-        if posts:
-            batch_id = generator.save_to_production_db(posts, 'linkedin')
-            print(f"✅ Large batch {batch_id} saved to production database")
-
-    elif choice == '3':
-        # 30-day calendar
-        print(f"\n📅 Generating 30-day content calendar...")
-        calendar = generator.generate_content_calendar(num_days=30)
-        print(f"✅ Content calendar generated and saved")
-
-    elif choice == '4':
-        # Custom batch
-        try:
-            num_posts = int(input("Number of posts (1-50): "))
-            platform = input("Platform (linkedin/twitter) [linkedin]: ").strip() or "linkedin"
-            num_posts = max(1, min(50, num_posts))
-
-            print(f"\n⚡ Generating {num_posts} {platform} posts...")
-            posts, _ = generator.generate_batch_sync(topics, num_posts, platform)
-            if posts:
-                batch_id = generator.save_to_production_db(posts, platform)
-                print(f"✅ Custom batch {batch_id} saved to production database")
-
-        except ValueError:
-            print("❌ Invalid number")
-
-    elif choice == '5':
-        # Analytics
-        print(f"\n📊 Production Analytics:")
-        analytics = generator.get_analytics_summary()
-
-        print(f"📝 Total Content Generated: {analytics['total_content_generated']}")
-        print(f"📤 Content Published: {analytics['content_published']}")
-        print(f"📋 Content Draft: {analytics['content_draft']}")
-
-        if analytics['platform_performance']:
-            print(f"\n📈 Platform Performance:")
-            for perf in analytics['platform_performance']:
-                print(f"  {perf['platform']}: {perf['avg_engagement']:.1f}% engagement")
-
-        if analytics['top_performing_topics']:
-            print(f"\n🏆 Top Performing Topics:")
-            for i, topic in enumerate(analytics['top_performing_topics'][:5], 1):
-                print(f"  {i}. {topic['topic']}: {topic['avg_engagement']:.1f}% engagement")
-
-    elif choice == '6':
-        # Emergency batch
-        print(f"\n🚨 EMERGENCY MODE: 100 posts")
-        print("This will take approximately 3-5 minutes...")
-
-        if input("Continue? (y/N): ").lower().startswith('y'):
-            posts, _ = generator.generate_batch_sync(topics, 100, 'linkedin')
-            if posts:
-                batch_id = generator.save_to_production_db(posts, 'linkedin')
-                print(f"✅ Emergency batch {batch_id} saved to production database")
+    action = MENU_ACTIONS.get(choice)
+    if action:
+        action(generator, topics)
 
     print(f"\n✨ Production content generation complete!")
     print(f"📈 System ready for lead generation and revenue generation")
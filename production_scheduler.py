@@ -1,10 +1,13 @@
+import heapq
 import time
 import threading
 import logging
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import json
 import os
+import sqlite3
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from scheduler import SocialMediaScheduler
 from metrics_tracker import MetricsTracker
@@ -33,7 +36,11 @@ class ProductionScheduler:
         self.metrics_tracker = MetricsTracker()
 
         # Configuration
-        self.check_interval = 60  # Check every minute
+        self.check_interval = 60  # Back-off after an error in the scheduler loop
+        self.persist_interval = 300  # Flush non-terminal state changes at most every 5 minutes
+        self.history_cap = 1000  # Recent history entries kept in memory; the state database keeps them all
+        self.state_db_path = 'outputs/scheduler_state.db'
+        self.legacy_state_file = 'outputs/scheduler_state.json'
         self.rate_limits = {
             'linkedin': {'posts_per_hour': 10, 'cooldown_minutes': 6},
             'twitter': {'posts_per_hour': 30, 'cooldown_minutes': 2}
@@ -41,8 +48,17 @@ class ProductionScheduler:
 
         # State tracking
         self.scheduled_posts: Dict[str, ScheduledPost] = {}
-        self.post_history: List[dict] = []
+        self._due_heap: List[Tuple[datetime, str]] = []  # (scheduled_time, post id), earliest first
+        self._by_status: Dict[str, set] = defaultdict(set)  # status -> post ids
+        self._queue_cv = threading.Condition()  # Guards queue state; notified when the next wake-up may change
+        self.post_history: deque = deque(maxlen=self.history_cap)
         self.last_post_times: Dict[str, datetime] = {}
+        self._post_buckets: Dict[str, deque] = defaultdict(deque)  # platform -> [minute, posts] for the last hour
+        self._dirty_posts = set()  # Post ids changed since the last save_state
+        self._unsaved_history: List[dict] = []
+        self._last_save = time.time()
+        self._db = None
+        self._db_lock = threading.Lock()
 
         # Threading
         self.running = False
@@ -54,7 +70,11 @@ class ProductionScheduler:
     def add_scheduled_post(self, post: ScheduledPost) -> bool:
         """Add a post to the scheduling queue"""
         try:
-            self.scheduled_posts[post.id] = post
+            with self._queue_cv:
+                self._index_post(post)
+                heapq.heappush(self._due_heap, (post.scheduled_time, post.id))
+                self._dirty_posts.add(post.id)
+                self._queue_cv.notify()
             self.logger.info(f"Added post {post.id} to queue - {post.platform} at {post.scheduled_time}")
             return True
         except Exception as e:
@@ -68,6 +88,7 @@ class ProductionScheduler:
                 calendar = json.load(f)
 
             platform = calendar_file.split('_')[0]  # linkedin or twitter
+            new_posts = []
 
             for item in calendar:
                 post_id = f"{platform}_{item['post_number']}_{int(time.time())}"
@@ -84,7 +105,7 @@ class ProductionScheduler:
                     self.logger.error(f"No profile ID found for {platform}")
                     continue
 
-                scheduled_time = datetime.strptime(item['publish_date'], '%Y-%m-%d')
+                scheduled_time = datetime.fromisoformat(item['publish_date'])
                 scheduled_time = scheduled_time.replace(hour=9, minute=0)  # Default to 9 AM
 
                 post = ScheduledPost(
@@ -95,16 +116,50 @@ class ProductionScheduler:
                     profile_id=profile_id,
                     post_metadata=item
                 )
+                new_posts.append(post)
 
-                self.add_scheduled_post(post)
+            # Queue the whole calendar at once: one heapify instead of a push per post
+            with self._queue_cv:
+                for post in new_posts:
+                    self._index_post(post)
+                    self._dirty_posts.add(post.id)
+                self._due_heap.extend((post.scheduled_time, post.id) for post in new_posts)
+                heapq.heapify(self._due_heap)
+                self._queue_cv.notify()
 
-            self.logger.info(f"Loaded {len(calendar)} posts from {calendar_file}")
+            self.logger.info(f"Loaded {len(new_posts)} posts from {calendar_file}")
 
         except Exception as e:
             self.logger.error(f"Error loading calendar {calendar_file}: {e}")
 
+    def _index_post(self, post: ScheduledPost):
+        """Store a post and file it under its status; caller holds _queue_cv"""
+        previous = self.scheduled_posts.get(post.id)
+        if previous:
+            self._by_status[previous.status].discard(post.id)
+        self.scheduled_posts[post.id] = post
+        self._by_status[post.status].add(post.id)
+
+    def _set_status(self, post: ScheduledPost, status: str):
+        """Change a post's status, keeping the status index and dirty set in step"""
+        with self._queue_cv:
+            self._by_status[post.status].discard(post.id)
+            post.status = status
+            self._by_status[status].add(post.id)
+            self._dirty_posts.add(post.id)
+
     def check_rate_limit(self, platform: str) -> bool:
         """Check if we're within rate limits for a platform"""
+        # Hourly quota: sum the per-minute buckets from the last 60 minutes
+        buckets = self._post_buckets[platform]
+        if buckets:
+            current_minute = int(time.time() // 60)
+            while buckets and buckets[0][0] <= current_minute - 60:
+                buckets.popleft()
+            if sum(count for _, count in buckets) >= self.rate_limits[platform]['posts_per_hour']:
+                return False
+
+        # Cooldown since the last post
         now = datetime.now()
         last_post = self.last_post_times.get(platform)
 
@@ -116,6 +171,15 @@ class ProductionScheduler:
 
         return time_since_last >= cooldown
 
+    def _record_post(self, platform: str):
+        """Count a successful post in the platform's current-minute bucket"""
+        current_minute = int(time.time() // 60)
+        buckets = self._post_buckets[platform]
+        if buckets and buckets[-1][0] == current_minute:
+            buckets[-1][1] += 1
+        else:
+            buckets.append([current_minute, 1])
+
     def post_to_platform(self, post: ScheduledPost) -> bool:
         """Post content to the platform"""
         try:
@@ -131,8 +195,9 @@ class ProductionScheduler:
             )
 
             if result.get('success') or result.get('id'):
-                post.status = "posted"
+                self._set_status(post, "posted")
                 self.last_post_times[post.platform] = datetime.now()
+                self._record_post(post.platform)
 
                 # Log to metrics
                 self.metrics_tracker.log_metrics(
@@ -161,20 +226,27 @@ class ProductionScheduler:
         now = datetime.now()
         posts_to_process = []
 
-        # Find posts ready to be posted
-        for post_id, post in self.scheduled_posts.items():
-            if post.status == "pending" and post.scheduled_time <= now:
-                posts_to_process.append(post)
+        # Pop posts that are due; entries for posts that were rescheduled or are no
+        # longer pending are stale and simply dropped
+        with self._queue_cv:
+            while self._due_heap and self._due_heap[0][0] <= now:
+                due_time, post_id = heapq.heappop(self._due_heap)
+                post = self.scheduled_posts.get(post_id)
+                if post and post.status == "pending" and post.scheduled_time == due_time:
+                    posts_to_process.append(post)
+                    self._dirty_posts.add(post_id)
 
         # Process each post
+        terminal = False
         for post in posts_to_process:
             self.logger.info(f"Processing post {post.id} for {post.platform}")
 
             success = self.post_to_platform(post)
 
             if success:
-                post.status = "posted"
-                self.post_history.append({
+                self._set_status(post, "posted")
+                terminal = True
+                self._record_history({
                     'post_id': post.id,
                     'platform': post.platform,
                     'posted_at': datetime.now().isoformat(),
@@ -183,8 +255,9 @@ class ProductionScheduler:
             else:
                 post.retry_count += 1
                 if post.retry_count >= post.max_retries:
-                    post.status = "failed"
-                    self.post_history.append({
+                    self._set_status(post, "failed")
+                    terminal = True
+                    self._record_history({
                         'post_id': post.id,
                         'platform': post.platform,
                         'posted_at': datetime.now().isoformat(),
@@ -195,63 +268,197 @@ class ProductionScheduler:
                 else:
                     # Schedule retry for 1 hour later
                     post.scheduled_time = datetime.now() + timedelta(hours=1)
+                    with self._queue_cv:
+                        heapq.heappush(self._due_heap, (post.scheduled_time, post.id))
                     self.logger.warning(f"Post {post.id} failed, scheduling retry {post.retry_count}/{post.max_retries}")
 
+        # Posted/failed transitions are persisted right away; retries wait for the next flush
+        self.persist_state(force=terminal)
+
+    def _record_history(self, entry: dict):
+        """Append a posted/failed event to the history and queue it for persistence"""
+        with self._queue_cv:
+            self.post_history.append(entry)
+            self._unsaved_history.append(entry)
+
+    def _get_db(self) -> sqlite3.Connection:
+        """Return the state database connection, creating it and its tables on first use"""
+        if self._db is None:
+            os.makedirs(os.path.dirname(self.state_db_path), exist_ok=True)
+            conn = sqlite3.connect(self.state_db_path, check_same_thread=False, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS scheduled_posts (
+                    id TEXT PRIMARY KEY,
+                    platform TEXT,
+                    content TEXT,
+                    scheduled_time TEXT,
+                    profile_id TEXT,
+                    retry_count INTEGER,
+                    max_retries INTEGER,
+                    status TEXT,
+                    metadata_json TEXT
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS post_history (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    post_id TEXT,
+                    platform TEXT,
+                    posted_at TEXT,
+                    status TEXT,
+                    retry_count INTEGER
+                )
+            ''')
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS last_post_times (
+                    platform TEXT PRIMARY KEY,
+                    posted_at TEXT
+                )
+            ''')
+            self._db = conn
+        return self._db
+
+    def persist_state(self, force: bool = False):
+        """Save state if it changed and the persist interval has elapsed (or force is set)"""
+        if (self._dirty_posts or self._unsaved_history) and (force or time.time() - self._last_save >= self.persist_interval):
+            self.save_state()
+
     def save_state(self):
-        """Save current state to file for persistence"""
-        state = {
-            'scheduled_posts': {pid: {
-                'id': p.id,
-                'platform': p.platform,
-                'content': p.content,
-                'scheduled_time': p.scheduled_time.isoformat(),
-                'profile_id': p.profile_id,
-                'retry_count': p.retry_count,
-                'status': p.status,
-                'post_metadata': p.post_metadata
-            } for pid, p in self.scheduled_posts.items()},
-            'post_history': self.post_history,
-            'last_post_times': {k: v.isoformat() for k, v in self.last_post_times.items()}
-        }
+        """Write posts and history entries changed since the last save to the state database"""
+        with self._queue_cv:
+            post_rows = [
+                (p.id, p.platform, p.content, p.scheduled_time.isoformat(), p.profile_id,
+                 p.retry_count, p.max_retries, p.status, json.dumps(p.post_metadata))
+                for p in (self.scheduled_posts.get(pid) for pid in self._dirty_posts) if p
+            ]
+            history_rows = [
+                (h['post_id'], h['platform'], h['posted_at'], h['status'], h.get('retry_count'))
+                for h in self._unsaved_history
+            ]
+            self._dirty_posts.clear()
+            self._unsaved_history = []
+        last_post_rows = [(k, v.isoformat()) for k, v in self.last_post_times.items()]
+
+        # Only rows that changed are written, all in one transaction
+        with self._db_lock, self._get_db() as conn:
+            conn.execute('BEGIN')
+            conn.executemany('''
+                INSERT OR REPLACE INTO scheduled_posts
+                (id, platform, content, scheduled_time, profile_id, retry_count, max_retries, status, metadata_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', post_rows)
+            conn.executemany(
+                'INSERT INTO post_history (post_id, platform, posted_at, status, retry_count) VALUES (?, ?, ?, ?, ?)',
+                history_rows
+            )
+            conn.executemany('INSERT OR REPLACE INTO last_post_times (platform, posted_at) VALUES (?, ?)', last_post_rows)
 
-        os.makedirs('outputs', exist_ok=True)
-        with open('outputs/scheduler_state.json', 'w') as f:
-            json.dump(state, f, indent=2)
+        self._last_save = time.time()
 
     def load_state(self):
-        """Load state from file"""
+        """Load state from the state database, importing a legacy JSON snapshot once"""
         try:
-            with open('outputs/scheduler_state.json', 'r') as f:
-                state = json.load(f)
+            with self._db_lock:
+                conn = self._get_db()
+                post_rows = conn.execute('''
+                    SELECT id, platform, content, scheduled_time, profile_id, retry_count, max_retries, status, metadata_json
+                    FROM scheduled_posts
+                ''').fetchall()
+                history_rows = conn.execute(
+                    'SELECT post_id, platform, posted_at, status, retry_count FROM post_history ORDER BY id DESC LIMIT ?',
+                    (self.history_cap,)
+                ).fetchall()
+                last_post_rows = conn.execute('SELECT platform, posted_at FROM last_post_times').fetchall()
+
+            if not post_rows and os.path.exists(self.legacy_state_file):
+                self._load_legacy_state()
+                return
 
             # Restore scheduled posts
-            for pid, post_data in state.get('scheduled_posts', {}).items():
-                post = ScheduledPost(
-                    id=post_data['id'],
-                    platform=post_data['platform'],
-                    content=post_data['content'],
-                    scheduled_time=datetime.fromisoformat(post_data['scheduled_time']),
-                    profile_id=post_data['profile_id'],
-                    retry_count=post_data['retry_count'],
-                    status=post_data['status'],
-                    post_metadata=post_data.get('post_metadata')
+            restored = [
+                ScheduledPost(
+                    id=pid,
+                    platform=platform,
+                    content=content,
+                    scheduled_time=datetime.fromisoformat(scheduled_time),
+                    profile_id=profile_id,
+                    retry_count=retry_count,
+                    max_retries=max_retries,
+                    status=status,
+                    post_metadata=json.loads(metadata_json)
                 )
-                self.scheduled_posts[pid] = post
+                for pid, platform, content, scheduled_time, profile_id, retry_count, max_retries, status, metadata_json in post_rows
+            ]
+            with self._queue_cv:
+                for post in restored:
+                    self._index_post(post)
 
             # Restore other state
-            self.post_history = state.get('post_history', [])
-            self.last_post_times = {
-                k: datetime.fromisoformat(v)
-                for k, v in state.get('last_post_times', {}).items()
-            }
-
+            self.post_history = deque(maxlen=self.history_cap)
+            for post_id, platform, posted_at, status, retry_count in reversed(history_rows):
+                entry = {'post_id': post_id, 'platform': platform, 'posted_at': posted_at, 'status': status}
+                if retry_count is not None:
+                    entry['retry_count'] = retry_count
+                self.post_history.append(entry)
+            self.last_post_times = {k: datetime.fromisoformat(v) for k, v in last_post_rows}
+
+            self._rebuild_due_heap()
             self.logger.info(f"Loaded {len(self.scheduled_posts)} scheduled posts from state")
 
-        except FileNotFoundError:
-            self.logger.info("No existing state file found, starting fresh")
         except Exception as e:
             self.logger.error(f"Error loading state: {e}")
 
+    def _load_legacy_state(self):
+        """Import the old JSON state snapshot into the state database"""
+        with open(self.legacy_state_file, 'r') as f:
+            state = json.load(f)
+
+        # Restore scheduled posts
+        for pid, post_data in state.get('scheduled_posts', {}).items():
+            post = ScheduledPost(
+                id=post_data['id'],
+                platform=post_data['platform'],
+                content=post_data['content'],
+                scheduled_time=datetime.fromisoformat(post_data['scheduled_time']),
+                profile_id=post_data['profile_id'],
+                retry_count=post_data['retry_count'],
+                status=post_data['status'],
+                post_metadata=post_data.get('post_metadata')
+            )
+            with self._queue_cv:
+                self._index_post(post)
+
+        # Restore other state
+        legacy_history = state.get('post_history', [])
+        self.post_history = deque(legacy_history, maxlen=self.history_cap)
+        self.last_post_times = {
+            k: datetime.fromisoformat(v)
+            for k, v in state.get('last_post_times', {}).items()
+        }
+
+        self._rebuild_due_heap()
+
+        # Write everything to the database once
+        with self._queue_cv:
+            self._dirty_posts.update(self.scheduled_posts)
+            self._unsaved_history = list(legacy_history)
+        self.save_state()
+
+        # Move the snapshot aside so later loads don't import its history again
+        os.replace(self.legacy_state_file, self.legacy_state_file + '.imported')
+
+        self.logger.info(f"Imported {len(self.scheduled_posts)} scheduled posts from {self.legacy_state_file}")
+
+    def _rebuild_due_heap(self):
+        """Rebuild the due-time heap from the pending posts"""
+        with self._queue_cv:
+            self._due_heap = [
+                (self.scheduled_posts[pid].scheduled_time, pid) for pid in self._by_status["pending"]
+            ]
+            heapq.heapify(self._due_heap)
+
     def scheduler_loop(self):
         """Main scheduler loop that runs continuously"""
         self.logger.info("Production scheduler started")
@@ -261,15 +468,29 @@ class ProductionScheduler:
                 # Process pending posts
                 self.process_pending_posts()
 
-                # Save state periodically
-                self.save_state()
+                # Save state periodically, only when something changed
+                self.persist_state()
 
-                # Wait before next check
-                time.sleep(self.check_interval)
+                # Sleep until the next post is due, a post is added, or stop() is called
+                with self._queue_cv:
+                    if self.running:
+                        self._queue_cv.wait(timeout=self._next_wakeup())
 
             except Exception as e:
                 self.logger.error(f"Error in scheduler loop: {e}")
-                time.sleep(self.check_interval)
+                with self._queue_cv:
+                    if self.running:
+                        self._queue_cv.wait(timeout=self.check_interval)
+
+    def _next_wakeup(self) -> Optional[float]:
+        """Seconds until the loop has work to do, or None to wait for a notify; caller holds _queue_cv"""
+        timeout = None
+        if self._due_heap:
+            timeout = max(0.0, (self._due_heap[0][0] - datetime.now()).total_seconds())
+        if self._dirty_posts or self._unsaved_history:
+            flush_in = max(0.0, self.persist_interval - (time.time() - self._last_save))
+            timeout = flush_in if timeout is None else min(timeout, flush_in)
+        return timeout
 
     def start(self):
         """Start the scheduler service"""
@@ -289,7 +510,9 @@ class ProductionScheduler:
 
     def stop(self):
         """Stop the scheduler service"""
-        self.running = False
+        with self._queue_cv:
+            self.running = False
+            self._queue_cv.notify_all()
         if self.scheduler_thread:
             self.scheduler_thread.join(timeout=10)
 
@@ -300,9 +523,10 @@ class ProductionScheduler:
 
     def get_status(self) -> dict:
         """Get current scheduler status"""
-        pending = len([p for p in self.scheduled_posts.values() if p.status == "pending"])
-        posted = len([p for p in self.scheduled_posts.values() if p.status == "posted"])
-        failed = len([p for p in self.scheduled_posts.values() if p.status == "failed"])
+        with self._queue_cv:
+            pending = len(self._by_status["pending"])
+            posted = len(self._by_status["posted"])
+            failed = len(self._by_status["failed"])
 
         return {
             'running': self.running,
@@ -41,17 +41,25 @@ PLATFORM_PROMPTS = {
     }
 }
 
+# Each template has a single {topic} slot, so split once at import into (prefix, suffix)
+_COMPILED = {
+    (platform, prompt_type): tuple(template.split("{topic}", 1))
+    for platform, prompts in PLATFORM_PROMPTS.items()
+    for prompt_type, template in prompts.items()
+}
+
 def get_prompt(platform: str, prompt_type: str, topic: str) -> str:
     """
     Retrieves a specific prompt template and formats it with the given topic.
     """
-    if platform not in PLATFORM_PROMPTS:
-        raise ValueError(f"Platform '{platform}' not supported.")
-    if prompt_type not in PLATFORM_PROMPTS[platform]:
-        raise ValueError(f"Prompt type '{prompt_type}' not supported for platform '{platform}'.")
+    try:
+        prefix, suffix = _COMPILED[(platform, prompt_type)]
+    except KeyError:
+        if platform not in PLATFORM_PROMPTS:
+            raise ValueError(f"Platform '{platform}' not supported.") from None
+        raise ValueError(f"Prompt type '{prompt_type}' not supported for platform '{platform}'.") from None
 
-    template = PLATFORM_PROMPTS[platform][prompt_type]
-    return template.format(topic=topic)
+    return prefix + str(topic) + suffix
 
 if __name__ == "__main__":
     # Example Usage
@@ -2,6 +2,11 @@ import requests
 import json
 from datetime import datetime, timedelta
 import os
+import hashlib
+from core.cache import disk_cache
+
+# Buffer profiles rarely change; reuse them across runs for a few minutes
+PROFILES_CACHE_TTL = 300
 
 class SocialMediaScheduler:
     def __init__(self, buffer_access_token):
@@ -12,13 +17,23 @@ class SocialMediaScheduler:
 
     def get_profiles(self):
         """Get all connected social media profiles"""
+        # Key on a digest of the token so the raw token never lands on disk
+        cache_key = ('get_profiles', hashlib.sha256(self.buffer_token.encode()).hexdigest())
+        if disk_cache is not None:
+            cached = disk_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         url = f"{self.base_url}/profiles.json"
         params = {'access_token': self.buffer_token}
 
         try:
             response = requests.get(url, params=params)
             response.raise_for_status() # Raise an exception for HTTP errors
-            return response.json()
+            profiles = response.json()
+            if disk_cache is not None:
+                disk_cache.set(cache_key, profiles, expire=PROFILES_CACHE_TTL)
+            return profiles
         except requests.exceptions.RequestException as e:
             print(f"Error getting Buffer profiles: {e}")
             return None
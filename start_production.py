@@ -10,7 +10,32 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from core.config import settings, Config
-from full_stack_dashboard import app
+from full_stack_dashboard import app, db, prefetch_calendars
+
+try:
+    from gunicorn.app.base import BaseApplication
+except ImportError:
+    BaseApplication = None
+
+if BaseApplication is not None:
+    class DashboardApplication(BaseApplication):
+        """Serve the dashboard with gunicorn's threaded workers"""
+
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return self.application
+
+def post_fork(server, worker):
+    # SQLite connections must not be shared across fork
+    db.reconnect()
 
 def main():
     """Production main entry point"""
@@ -43,12 +68,25 @@ def main():
     print("=" * 60)
 
     try:
-        # Run production server
-        app.run(
-            host=settings.HOST,
-            port=settings.PORT,
-            debug=False
-        )
+        if BaseApplication is not None:
+            # Warm the calendar caches once; forked workers inherit them
+            prefetch_calendars()
+            print(f"   Workers: {settings.WEB_WORKERS} x {settings.WEB_THREADS} threads")
+            DashboardApplication(app, {
+                'bind': f"{settings.HOST}:{settings.PORT}",
+                'workers': settings.WEB_WORKERS,
+                'worker_class': 'gthread',
+                'threads': settings.WEB_THREADS,
+                'post_fork': post_fork,
+            }).run()
+        else:
+            # gunicorn not installed - fall back to the threaded dev server
+            app.run(
+                host=settings.HOST,
+                port=settings.PORT,
+                debug=False,
+                threaded=True
+            )
     except KeyboardInterrupt:
         print("\n👋 Production server stopped by user")
     except Exception as e:
@@ -469,7 +469,7 @@ class DashboardManager {
     updateTopContentList(data) {
         const container = document.getElementById('topContentList');
 
-        if (!data || data.length === 0) {
+        if (!data || !data.rows || data.rows.length === 0) {
             container.innerHTML = `
                 <div class="text-center text-muted py-4">
                     <i class="bi bi-inbox"></i>
@@ -479,17 +479,20 @@ class DashboardManager {
             return;
         }
 
-        container.innerHTML = data.slice(0, 5).map((item, index) => `
+        // Rows arrive as arrays; look up each field by its column offset
+        const col = Object.fromEntries(data.columns.map((name, i) => [name, i]));
+
+        container.innerHTML = data.rows.slice(0, 5).map((row, index) => `
             <div class="top-content-item fade-in" style="animation-delay: ${index * 0.1}s">
                 <div>
-                    <div class="content-title">${item.topic}</div>
+                    <div class="content-title">${row[col.topic]}</div>
                     <div class="content-meta">
-                        <span class="platform-badge platform-${item.platform}">${item.platform}</span>
-                        <span class="ms-2">${item.post_count || 1} posts</span>
+                        <span class="platform-badge platform-${row[col.platform]}">${row[col.platform]}</span>
+                        <span class="ms-2">${row[col.post_count] || 1} posts</span>
                     </div>
                 </div>
                 <div class="engagement-badge">
-                    ${(item.avg_engagement || 0).toFixed(1)}% engagement
+                    ${(row[col.avg_engagement] || 0).toFixed(1)}% engagement
                 </div>
             </div>
         `).join('');
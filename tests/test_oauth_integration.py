@@ -0,0 +1,41 @@
+import unittest
+import os
+import shutil
+import tempfile
+import oauth_integration
+from oauth_integration import OAuthManager
+
+@unittest.skipIf(oauth_integration.AESGCMSIV is None, "cryptography is not installed")
+class TestOAuthManager(unittest.TestCase):
+
+    def setUp(self):
+        # init_database creates ./data, so run each test from a scratch directory
+        self.original_dir = os.getcwd()
+        self.work_dir = tempfile.mkdtemp()
+        os.chdir(self.work_dir)
+        self.manager = OAuthManager(db_path=os.path.join('data', 'social_credentials.db'))
+
+    def tearDown(self):
+        self.manager.close()
+        os.chdir(self.original_dir)
+        shutil.rmtree(self.work_dir)
+
+    def test_credentials_round_trip_encrypted(self):
+        self.manager.setup_platform_credentials(
+            'linkedin', 'client_123', 'super-secret', 'http://localhost:5000/callback'
+        )
+
+        stored = self.manager._conn().execute(
+            'SELECT client_secret_encrypted FROM oauth_credentials WHERE platform = ?', ('linkedin',)
+        ).fetchone()[0]
+        self.assertNotIn('super-secret', stored)
+        self.assertEqual(self.manager._decrypt_sensitive_data(stored), 'super-secret')
+
+    def test_state_token_is_single_use(self):
+        state = self.manager.generate_state_token('twitter')
+
+        self.assertEqual(self.manager.validate_state_token(state), 'twitter')
+        self.assertIsNone(self.manager.validate_state_token(state))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import os
+import json
+import shutil
+import sqlite3
+import sys
+import tempfile
+import types
+
+# metrics_tracker is not part of this tree; give production_scheduler a no-op tracker to import
+if 'metrics_tracker' not in sys.modules:
+    try:
+        import metrics_tracker  # noqa: F401
+    except ImportError:
+        metrics_tracker_stub = types.ModuleType('metrics_tracker')
+        metrics_tracker_stub.MetricsTracker = type('MetricsTracker', (), {'log_metrics': lambda self, **kwargs: None})
+        sys.modules['metrics_tracker'] = metrics_tracker_stub
+
+from production_scheduler import ProductionScheduler
+
+class TestProductionSchedulerState(unittest.TestCase):
+
+    def setUp(self):
+        self.state_dir = tempfile.mkdtemp()
+        self.state_db_path = os.path.join(self.state_dir, 'scheduler_state.db')
+        self.legacy_state_file = os.path.join(self.state_dir, 'scheduler_state.json')
+
+        # Legacy JSON snapshot with one history entry and no scheduled posts
+        with open(self.legacy_state_file, 'w') as f:
+            json.dump({
+                "scheduled_posts": {},
+                "post_history": [
+                    {"post_id": "post_1", "platform": "linkedin", "posted_at": "2025-10-27T09:00:00", "status": "posted"}
+                ],
+                "last_post_times": {}
+            }, f)
+
+    def tearDown(self):
+        shutil.rmtree(self.state_dir)
+
+    def _make_scheduler(self):
+        scheduler = ProductionScheduler('test_token')
+        scheduler.state_db_path = self.state_db_path
+        scheduler.legacy_state_file = self.legacy_state_file
+        return scheduler
+
+    def _history_count(self):
+        conn = sqlite3.connect(self.state_db_path)
+        try:
+            return conn.execute('SELECT COUNT(*) FROM post_history').fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_legacy_state_imported_once(self):
+        self._make_scheduler().load_state()
+        self.assertEqual(self._history_count(), 1)
+        self.assertFalse(os.path.exists(self.legacy_state_file))
+        self.assertTrue(os.path.exists(self.legacy_state_file + '.imported'))
+
+        scheduler = self._make_scheduler()
+        scheduler.load_state()
+        self.assertEqual(self._history_count(), 1)
+        self.assertEqual(len(scheduler.post_history), 1)
+
+if __name__ == '__main__':
+    unittest.main()